@@ -43,6 +43,8 @@ class TaskConfiguration:
         self.directory = cwd
         self.logFilePath = self.directory / \
             (log if log else Const.DefaultLoggingFileName)
+        for handler in logging.getLogger().handlers:  # Previous run's records
+            handler.flush()
         with open(self.logFilePath, "a") as mainLogFile:
             mainLogFile.write("\n" + "=" * 240 + "\n\n")
         setupLoggers(self.logFilePath, resetRootLoggerConfig,
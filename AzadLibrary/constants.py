@@ -7,6 +7,7 @@ This module should not import any other part of Azad library.
 from enum import Enum
 from decimal import Decimal
 from fractions import Fraction
+import math
 import os
 from sys import float_info
 import typing
@@ -39,6 +40,10 @@ DefaultValidatorTL = 10.0
 # Stress testing related
 DefaultBatchSize = 20
 
+# I/O files cleaning related
+ParallelRemovalThreshold = 256
+MaxRemovalThreads = 32
+
 # Log related
 DefaultLoggingFileName = "azadlib.log"
 DefaultLogFileMaxSize = 10 * (2 ** 20)  # 10MB
@@ -62,6 +67,22 @@ def __IODataTypesInfo_StringConstraints(x: str):
         return '"' not in x
 
 
+def __IODataTypesInfo_IntegerConstraint(iovt) -> typing.Callable[[int], bool]:
+    """
+    Return constraint function for integer I/O of given type.
+    """
+    low, high = IntegerTypesRange[iovt]
+    return lambda x: low <= x <= high
+
+
+def __IODataTypesInfo_FloatConstraint(iovt) -> typing.Callable[[float], bool]:
+    """
+    Return constraint function for floating point I/O of given type.
+    """
+    low, high = FloatTypesRange[iovt]
+    return lambda x: low <= abs(x) <= high or x == 0
+
+
 def __IODataTypesInfo_FloatStrize(x: typing.Union[float, Decimal, Fraction]):
     """
     Strize function for floating point numbers.
@@ -79,10 +100,18 @@ def checkPrecision(a: float, b: float,
     """
     if precision <= 0:
         raise ValueError("Non-positive precision %f given" % (precision,))
-    elif abs(a) <= precision ** 2:
-        return abs(a - b) <= precision
-    else:
-        return abs(a - b) <= precision or abs((a - b) / a) <= precision
+    difference = abs(a - b)
+    if difference <= precision:
+        return True
+    absA = abs(a)
+    if absA <= precision ** 2:
+        return False
+    elif isinstance(difference, float) and \
+            math.isfinite(difference) and math.isfinite(absA):
+        # Relative error check, multiplied instead of divided by `a`.
+        return difference <= precision * absA
+    else:  # Non-finite or non-float(like `Decimal`) values
+        return difference / absA <= precision
 
 
 class IOVariableTypes(Enum):
@@ -120,29 +149,41 @@ def getIOVariableType(s: str) -> IOVariableTypes:
     raise ValueError("There is no such IODataType '%s'" % (s,))
 
 
+# Value ranges of integer I/O data types.
+IntegerTypesRange = {
+    IOVariableTypes.INT: (-(2**31), 2**31 - 1),
+    IOVariableTypes.LONG: (-(2**63), 2**63 - 1),
+}
+
+# Ranges of nonzero absolute values of floating point I/O data types.
+FloatTypesRange = {
+    IOVariableTypes.FLOAT: (1.175494351e-38, 3.402823466e38),
+    IOVariableTypes.DOUBLE: (float_info.min, float_info.max),
+}
+
 # Information of I/O data types.
 IODataTypesInfo = {
     IOVariableTypes.INT: {
         "pytypes": (int,),
-        "constraint": (lambda x: -(2**31) <= x <= 2**31 - 1),
+        "constraint": __IODataTypesInfo_IntegerConstraint(IOVariableTypes.INT),
         "strize": (lambda x: "%d" % (x,)),
         "equal": (lambda x, y: x == y),
     },
     IOVariableTypes.LONG: {
         "pytypes": (int,),
-        "constraint": (lambda x: -(2**63) <= x <= 2**63 - 1),
+        "constraint": __IODataTypesInfo_IntegerConstraint(IOVariableTypes.LONG),
         "strize": (lambda x: "%d" % (x,)),
         "equal": (lambda x, y: x == y),
     },
     IOVariableTypes.FLOAT: {
         "pytypes": (float, Decimal, Fraction, int),
-        "constraint": (lambda x: 1.175494351e-38 <= abs(x) <= 3.402823466e38 or x == 0),
+        "constraint": __IODataTypesInfo_FloatConstraint(IOVariableTypes.FLOAT),
         "strize": __IODataTypesInfo_FloatStrize,
         "equal": checkPrecision,
     },
     IOVariableTypes.DOUBLE: {
         "pytypes": (float, Decimal, Fraction, int),
-        "constraint": (lambda x: float_info.min <= abs(x) <= float_info.max or x == 0),
+        "constraint": __IODataTypesInfo_FloatConstraint(IOVariableTypes.DOUBLE),
         "strize": __IODataTypesInfo_FloatStrize,
         "equal": checkPrecision,
     },
@@ -322,7 +363,7 @@ class __NullSemaphoreClass:
     use `NullSemaphore` for convenience.
 
     >>> import threading
-    >>> semaphore = threading.BoundedSemaphore()
+    >>> semaphore = threading.Lock()
     >>> force = True
     >>> with semaphore if not force else NullSemaphore:
     >>>     pass
@@ -12,6 +12,7 @@ import gc
 import logging
 import warnings
 import uuid
+import functools
 from string import Template as StringTemplate
 
 logger = logging.getLogger(__name__)
@@ -63,9 +64,8 @@ class AzadCore:
                     self.concurrencyCount)
 
         # Replace precision equality function
-        _iovt_precision_eq = (
-            lambda x, y: Const.checkPrecision(
-                x, y, precision=self.config.floatPrecision))
+        _iovt_precision_eq = functools.partial(
+            Const.checkPrecision, precision=self.config.floatPrecision)
         Const.IODataTypesInfo[Const.IOVariableTypes.FLOAT]["equal"] = \
             _iovt_precision_eq
         Const.IODataTypesInfo[Const.IOVariableTypes.DOUBLE]["equal"] = \
@@ -238,8 +238,7 @@ class AzadCore:
                 "Generator process failed on %s; Please check log file" %
                 (", ".join("#%d" % (i + 1,) for i in failedIndices),))
         else:  # Successfully generated
-            for _0, _1, errLog in results:
-                self.fs.pop(errLog)
+            self.fs.popMany(errLog for (_0, _1, errLog) in results)
             gc.collect()
             return [inputDataPath for (_0, inputDataPath, _2) in results]
 
@@ -285,8 +284,7 @@ class AzadCore:
                 "Validation process failed on %s; Please check log file" %
                 (", ".join("#%d" % (i + 1,) for i in failedIndices),))
         else:
-            for _0, _1, errLog in results:
-                self.fs.pop(errLog)
+            self.fs.popMany(errLog for (_0, _1, errLog) in results)
             gc.collect()
 
     def generateOutput(
@@ -366,9 +364,8 @@ class AzadCore:
 
         # Should return verdicts
         if returnVerdicts:
-            for _0, outFile, errLog in result:
-                self.fs.pop(outFile)
-                self.fs.pop(errLog)
+            self.fs.popMany(path for (_0, outFile, errLog) in result
+                            for path in (outFile, errLog))
             return verdicts
 
         # What if verdict is wrong? Raise an error instead.
@@ -403,8 +400,7 @@ class AzadCore:
 
         # Success, now let's remove error log.
         else:
-            for _0, _1, errLog in result:
-                self.fs.pop(errLog)
+            self.fs.popMany(errLog for (_0, _1, errLog) in result)
             gc.collect()
             return [outfilePath for (_0, outfilePath, _2) in result] if raiseOnInvalidVerdict \
                 else [(verdicts[i], result[i][1], dtDistribution[i]) for i in range(len(inputFiles))]
@@ -536,8 +532,7 @@ class AzadCore:
                         " ".join(maliciousGenscript))
                 raise Errors.AzadError("Malicious genscripts found")
 
-            for inputFile in inputFiles:
-                self.fs.pop(inputFile)
+            self.fs.popMany(inputFiles)
             currentIndex = nextIndex
 
         logger.info("Couldn't find any malicious genscript.")
@@ -550,7 +545,8 @@ class AzadCore:
         for i in range(len(inFiles)):
             outPath = self.config.IOPath / \
                 (self.config.inputFilePathSyntax % (i + 1,))
-            logger.debug("Writing '%s'..", formatPathForLog(outPath))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Writing '%s'..", formatPathForLog(outPath))
             iterator = IOData.yieldLines(inFiles[i])
             data = [IOData.parseMulti(iterator, paramType, dimension)
                     for (_0, paramType, dimension) in self.config.parameters]
@@ -567,7 +563,8 @@ class AzadCore:
         for i in range(len(answers)):
             outPath = self.config.IOPath / \
                 (self.config.outputFilePathSyntax % (i + 1,))
-            logger.debug("Writing '%s'..", formatPathForLog(outPath))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Writing '%s'..", formatPathForLog(outPath))
             with open(outPath, "wb") as outFile:
                 outFile.write(IOData.PGizeData(
                     answers[i], self.config.returnType).encode('ascii'))
@@ -581,7 +578,8 @@ class AzadCore:
         for i in range(len(results)):
             if not results[i]: continue # Skips TLE/MLE/FAIL
             outPath = self.config.invocationPath / str(solutionIndex) / (self.config.outputFilePathSyntax % (i + 1,))
-            logger.debug("Writing '%s'..", formatPathForLog(outPath))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Writing '%s'..", formatPathForLog(outPath))
             with open(outPath, "wb") as outFile:
                 outFile.write(IOData.PGizeData(
                     results[i], self.config.returnType).encode('ascii'))
@@ -604,8 +602,7 @@ class AzadCore:
         IOData.cleanIOFilePath(self.config.IOPath)
         self.writePGInFiles(inputDataFiles)
         self.writePGOutFiles(answers)
-        for file in inputDataFiles:
-            self.fs.pop(file)
+        self.fs.popMany(inputDataFiles)
         logger.info("PG-transformed and wrote all data into files.")
     
     def runInvocationPipeline(self):
@@ -685,8 +682,7 @@ class AzadCore:
         IOData.cleanIOFilePath(self.config.IOPath)
         self.writePGInFiles(inputFiles)
         self.writePGOutFiles(answers)
-        for file in inputFiles:
-            self.fs.pop(file)
+        self.fs.popMany(inputFiles)
 
         # Write PGized Out files (other solutions)
         solutionIndex = -1
@@ -17,7 +17,8 @@ logger = logging.getLogger(__name__)
 # Azad libraries
 from .. import constants as Const
 from ..filesystem import TempFileSystem
-from ..misc import formatPathForLog, isExistingFile, getLimitResourceFunction, prlimitSubprocessResource
+from ..misc import formatPathForLog, isExistingFile, getLimitResourceFunction, prlimitSubprocessResource, \
+    waitSubprocess
 from ..errors import AzadError
 
 
@@ -29,9 +30,25 @@ class AbstractProgrammingLanguage:
     # Default indentation
     defaultIndentation = 4
 
-    # typeStrTable[IOVT][dimension] is corresponding type in language.
+    # baseTypeStrTable[IOVT] is corresponding base type in language.
     baseTypeStrTable = {iovt: NotImplemented for iovt in Const.IOVariableTypes}
 
+    # typeStrTable[(IOVT, dimension)] is corresponding type in language.
+    # This is built from `typeStr` when child class is defined, and
+    # type strings are interned to be shared between sibling classes.
+    typeStrTable: typing.Mapping[
+        typing.Tuple[Const.IOVariableTypes, int], str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        try:
+            cls.typeStrTable = {
+                (iovt, dimension): sys.intern(cls.typeStr(iovt, dimension))
+                for iovt in Const.IOVariableTypes
+                for dimension in range(Const.MaxParameterDimensionAllowed + 1)}
+        except NotImplementedError:  # Abstract or no typeStr (e.g. JS)
+            cls.typeStrTable = {}
+
     @classmethod
     def typeStr(cls, iovt: Const.IOVariableTypes, dimension: int):
         """
@@ -161,14 +178,20 @@ class AbstractExternalModule:
         """
         raise NotImplementedError
 
+    # Cache of templates read by `replaceSymbols`
+    templateCache: typing.Dict[Path, StringTemplate] = {}
+
     @staticmethod
     def replaceSymbols(sourceCodePath: Path, mapping: dict) -> str:
         """
         Read sourcecode and replace symbols by mapping.
+        Each sourcecode is read only once and cached as template.
         """
-        with open(sourceCodePath, "r") as sourceCodeFile:
-            template = StringTemplate(sourceCodeFile.read())
-        return template.substitute(mapping)
+        cache = AbstractExternalModule.templateCache
+        if sourceCodePath not in cache:
+            with open(sourceCodePath, "r") as sourceCodeFile:
+                cache[sourceCodePath] = StringTemplate(sourceCodeFile.read())
+        return cache[sourceCodePath].substitute(mapping)
 
     # Global semaphore for invocation
     globalInvokeSemaphore = threading.BoundedSemaphore()
@@ -216,7 +239,7 @@ class AbstractExternalModule:
                 else:
                     raise OSError("Unsupported OS %s" % (sys.platform,))
 
-            exitcode = P.wait(60)  # One minute for max
+            exitcode = waitSubprocess(P, 60)  # One minute for max
             for ec in Const.ExitCode:
                 if ec.value == exitcode or ec.value + 256 == exitcode:
                     result = ec
@@ -225,10 +248,11 @@ class AbstractExternalModule:
             result = Const.ExitCode.Killed
             P.kill()
         finally:  # Close file objects
-            logger.debug("Executed \"%s\" with TL = %ds, ML = %gMB, exitcode = %d (%s)",
-                         [formatPathForLog(arg) if isinstance(
-                             arg, Path) else arg for arg in P.args],
-                         timelimit, memorylimit, P.returncode, result.name)
+            if logger.isEnabledFor(logging.DEBUG):  # Skip formatting args
+                logger.debug("Executed \"%s\" with TL = %ds, ML = %gMB, exitcode = %d (%s)",
+                             [formatPathForLog(arg) if isinstance(
+                                 arg, Path) else arg for arg in P.args],
+                             timelimit, memorylimit, P.returncode, result.name)
             if stdin != DEVNULL:
                 stdin.close()
             if stderr != DEVNULL:
@@ -270,6 +294,12 @@ class AbstractExternalModule:
             content=content, extension=extension,
             namePrefix=namePrefix, basePath=self.basePath)
 
+    def newTempFiles(self, *specs: dict) -> typing.List[Path]:
+        """
+        Alias of `self.fs.newTempFiles`, but with `self.basePath`.
+        """
+        return self.fs.newTempFiles(*specs, basePath=self.basePath)
+
     def newTempFileByCopy(
             self, original: Path, extension: str = None,
             namePrefix: str = None) -> Path:
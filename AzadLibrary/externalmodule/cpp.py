@@ -65,33 +65,42 @@ class AbstractCpp(AbstractProgrammingLanguage):
         result = super().templateDict(**kwargs)
 
         # Parameter arguments (for all modules)
+        typeStrTable = cls.typeStrTable
         result["ParameterArgs"] = ", ".join(
-            "%s %s" % (cls.typeStr(pType, dimension), pName)
+            "%s %s" % (typeStrTable[pType, dimension], pName)
             for pName, pType, dimension in parameterInfo)
         result["ParameterArgsRef"] = ", ".join(
-            "%s &%s" % (cls.typeStr(pType, dimension), pName)
+            "%s &%s" % (typeStrTable[pType, dimension], pName)
             for pName, pType, dimension in parameterInfo)
         result["SendParameters"] = ", ".join(
             cls.vnameByPname(pName) for pName, _1, _2 in parameterInfo)
 
+        # Separators and code generators
+        initSeparator = cls.leveledNewline(cls.indentLevelParameterInit)
+        getSeparator = cls.leveledNewline(cls.indentLevelParameterGet)
+        printSeparator = cls.leveledNewline(cls.indentLevelParameterPrint)
+        generateInit = cls.generateCodeInitParameter
+        generateGet = cls.generateCodeGetParameter
+        generatePut = cls.generateCodePutParameter
+
         # Init all parameters (for all modules)
-        result["InitParameters"] = cls.leveledNewline(cls.indentLevelParameterInit).join(
-            cls.generateCodeInitParameter(*param) for param in parameterInfo)
+        result["InitParameters"] = initSeparator.join(
+            generateInit(*param) for param in parameterInfo)
 
         # Get all parameters (for validators and solutions)
-        result["GetParameters"] = cls.leveledNewline(cls.indentLevelParameterGet).join(
-            cls.generateCodeGetParameter(*param) for param in parameterInfo)
+        result["GetParameters"] = getSeparator.join(
+            generateGet(*param) for param in parameterInfo)
 
         # Print all parameters (for generators)
-        result["PrintParameters"] = cls.leveledNewline(cls.indentLevelParameterPrint).join(
-            cls.generateCodePutParameter(*param) for param in parameterInfo)
+        result["PrintParameters"] = printSeparator.join(
+            generatePut(*param) for param in parameterInfo)
 
         # Result info
         if returnInfo:
             returnType, returnDimension = returnInfo
-            result["ReturnType"] = cls.typeStr(returnType, returnDimension)
+            result["ReturnType"] = typeStrTable[returnType, returnDimension]
             result["ReturnDimension"] = returnDimension
-            result["ReturnTypeBase"] = cls.typeStr(returnType, 0)
+            result["ReturnTypeBase"] = typeStrTable[returnType, 0]
 
         # Return
         return result
@@ -102,7 +111,7 @@ class AbstractCpp(AbstractProgrammingLanguage):
             parameterType: Const.IOVariableTypes,
             parameterDimension: int) -> str:
         return "%s %s;" % \
-            (cls.typeStr(parameterType, parameterDimension),
+            (cls.typeStrTable[parameterType, parameterDimension],
              cls.vnameByPname(variableName))
 
     @classmethod
@@ -112,7 +121,7 @@ class AbstractCpp(AbstractProgrammingLanguage):
             parameterDimension: int) -> str:
         return "%s = TCH::Data<%s, %d>::get(std::cin);" % \
             (cls.vnameByPname(variableName),
-             cls.typeStr(parameterType, 0),
+             cls.typeStrTable[parameterType, 0],
              parameterDimension)
 
     @classmethod
@@ -121,7 +130,7 @@ class AbstractCpp(AbstractProgrammingLanguage):
             parameterType: Const.IOVariableTypes,
             parameterDimension: int) -> str:
         return "TCH::Data<%s, %d>::put(outfile, %s);" % \
-            (cls.typeStr(parameterType, 0),
+            (cls.typeStrTable[parameterType, 0],
              parameterDimension,
              cls.vnameByPname(variableName))
 
@@ -166,16 +175,15 @@ class CppGenerator(AbstractExternalGenerator, AbstractCpp):
 
         # Prepare original stuffs
         code = self.generateCode(self.parameterInfo)
-        self.modulePath = self.newTempFile(
-            content=code, extension="cpp", namePrefix="generator")
+        self.modulePath, self.executable, compilationErrorLog = \
+            self.newTempFiles(
+                {"content": code, "extension": "cpp", "namePrefix": "generator"},
+                {"extension": "exe", "namePrefix": "generator"},
+                {"extension": "log", "namePrefix": "err"})
 
         # Compile
-        self.executable = self.newTempFile(
-            extension="exe", namePrefix="generator")
         compilationArgs = self.generateCompilationArgs(
             self.modulePath, self.executable, self.originalSourceCodePath)
-        compilationErrorLog = self.newTempFile(
-            extension="log", namePrefix="err")
         compilationExitCode = self.invoke(
             compilationArgs, stderr=compilationErrorLog,
             cwd=self.basePath)
@@ -219,16 +227,15 @@ class CppValidator(AbstractExternalValidator, AbstractCpp):
 
         # Prepare original stuffs
         code = self.generateCode(self.parameterInfo, self.returnInfo)
-        self.modulePath = self.newTempFile(
-            content=code, extension="cpp", namePrefix="validator")
+        self.modulePath, self.executable, compilationErrorLog = \
+            self.newTempFiles(
+                {"content": code, "extension": "cpp", "namePrefix": "validator"},
+                {"extension": "exe", "namePrefix": "validator"},
+                {"extension": "log", "namePrefix": "err"})
 
         # Compile
-        self.executable = self.newTempFile(
-            extension="exe", namePrefix="validator")
         compilationArgs = self.generateCompilationArgs(
             self.modulePath, self.executable, self.originalSourceCodePath)
-        compilationErrorLog = self.newTempFile(
-            extension="log", namePrefix="err")
         compilationExitCode = self.invoke(
             compilationArgs, stderr=compilationErrorLog,
             cwd=self.basePath)
@@ -272,17 +279,16 @@ class CppSolution(AbstractExternalSolution, AbstractCpp):
 
         # Prepare original stuffs
         code = self.generateCode(self.parameterInfo, self.returnInfo)
-        self.modulePath = self.newTempFile(
-            content=code, extension="cpp", namePrefix="solution")
+        self.modulePath, self.executable, compilationErrorLog = \
+            self.newTempFiles(
+                {"content": code, "extension": "cpp", "namePrefix": "solution"},
+                {"extension": "exe", "namePrefix": "solution"},
+                {"extension": "log", "namePrefix": "err"})
 
         # Compile
-        self.executable = self.newTempFile(
-            extension="exe", namePrefix="solution")
         compilationArgs = self.generateCompilationArgs(
             self.modulePath, self.executable,
             self.originalSourceCodePath)
-        compilationErrorLog = self.newTempFile(
-            extension="log", namePrefix="err")
         compilationExitCode = self.invoke(
             compilationArgs, stderr=compilationErrorLog,
             cwd=self.basePath)
@@ -459,19 +465,23 @@ class CSolution(AbstractExternalSolution, AbstractC):
 
         # Prepare original stuffs
         code = self.generateCode(self.parameterInfo, self.returnInfo)
-        self.modulePath = self.newTempFile(
-            content=code, extension="cpp", namePrefix="solution")
+        (self.modulePath, executableTempC, executableTempCpp,
+         self.executable, compilationErrorLog1, compilationErrorLog2,
+         compilationErrorLog3) = self.newTempFiles(
+            {"content": code, "extension": "cpp", "namePrefix": "solution"},
+            {"extension": "exe", "namePrefix": "solution"},
+            {"extension": "exe", "namePrefix": "solution"},
+            {"extension": "exe", "namePrefix": "solution"},
+            {"extension": "log", "namePrefix": "err"},
+            {"extension": "log", "namePrefix": "err"},
+            {"extension": "log", "namePrefix": "err"})
 
         # Compile: C
-        executableTempC = self.newTempFile(
-            extension="exe", namePrefix="solution")
         compilationArgs1 = [
             "gcc", "-c", self.originalSourceCodePath,
             "-std=c11", "-O2", "-Wall",
             "-I", self.helperHeadersPath,
             "-o", executableTempC]
-        compilationErrorLog1 = self.newTempFile(
-            extension="log", namePrefix="err")
         compilationExitCode1 = self.invoke(
             compilationArgs1, stderr=compilationErrorLog1,
             cwd=self.basePath)
@@ -483,16 +493,12 @@ class CSolution(AbstractExternalSolution, AbstractC):
                 compilationArgs1, Const.SourceFileType.Solution)
 
         # Compile: C++
-        executableTempCpp = self.newTempFile(
-            extension="exe", namePrefix="solution")
         compilationArgs2 = [
             "g++", "-c", self.modulePath,
             "-std=c++17", "-O2", "-Wall",
             "-I", self.helperHeadersPath,
             "-o", executableTempCpp
         ]
-        compilationErrorLog2 = self.newTempFile(
-            extension="log", namePrefix="err")
         compilationExitCode2 = self.invoke(
             compilationArgs2, stderr=compilationErrorLog2,
             cwd=self.basePath)
@@ -504,14 +510,10 @@ class CSolution(AbstractExternalSolution, AbstractC):
                 compilationArgs2, Const.SourceFileType.Solution)
 
         # Compile: Together
-        self.executable = self.newTempFile(
-            extension="exe", namePrefix="solution")
         compilationArgs3 = [
             "g++", executableTempC, executableTempCpp,
             "-o", self.executable
         ]
-        compilationErrorLog3 = self.newTempFile(
-            extension="log", namePrefix="err")
         compilationExitCode3 = self.invoke(
             compilationArgs3, stderr=compilationErrorLog3,
             cwd=self.basePath)
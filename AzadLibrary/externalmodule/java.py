@@ -67,7 +67,7 @@ class AbstractJava(AbstractProgrammingLanguage):
         # Result info
         if returnInfo:
             returnType, returnDimension = returnInfo
-            result["ReturnType"] = cls.typeStr(returnType, returnDimension)
+            result["ReturnType"] = cls.typeStrTable[returnType, returnDimension]
             result["ReturnDimension"] = returnDimension
 
         # Return
@@ -79,7 +79,7 @@ class AbstractJava(AbstractProgrammingLanguage):
             parameterType: Const.IOVariableTypes,
             parameterDimension: int) -> str:
         return "%s %s;" % \
-            (cls.typeStr(parameterType, parameterDimension),
+            (cls.typeStrTable[parameterType, parameterDimension],
              cls.vnameByPname(variableName))
 
     @classmethod
@@ -89,7 +89,7 @@ class AbstractJava(AbstractProgrammingLanguage):
             parameterDimension: int) -> str:
         return "%s = tchio.get%dd%s(sc);" % \
             (cls.vnameByPname(variableName), parameterDimension,
-             cls.typeStr(parameterType, 0))
+             cls.typeStrTable[parameterType, 0])
 
 
 class JavaSolution(AbstractExternalSolution, AbstractJava):
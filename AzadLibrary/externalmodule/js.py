@@ -66,17 +66,16 @@ class AbstractJs(AbstractProgrammingLanguage):
         """
         result = super().templateDict(**kwargs)
 
-        def registerPath(key: str, path: Path):
-            if path:
-                if not isExistingFile(path):
-                    raise OSError(
-                        "Given path(key = %s, path = %s) isn't existing file" % (key, path)
-                    )
-                result[key] = './' + removeExtension(path)
-
         # Set paths
-        registerPath("JsIOHelperPath", ioHelperPath)
-        registerPath("SolutionPath", solutionPath)
+        paths = tuple((key, path) for (key, path) in (
+            ("JsIOHelperPath", ioHelperPath),
+            ("SolutionPath", solutionPath)) if path)
+        for key, path in paths:
+            if not isExistingFile(path):
+                raise OSError(
+                    "Given path(key = %s, path = %s) isn't existing file" % (key, path)
+                )
+        result.update((key, './' + removeExtension(path)) for (key, path) in paths)
 
         # Init parameters
         result["InitParameters"] = cls.leveledNewline(cls.indentLevelInitParameter).join(
@@ -4,6 +4,7 @@ This module provides implementation of Python3 external module.
 
 # Standard libraries
 import typing
+import functools
 from pathlib import Path
 
 # Azad libraries
@@ -57,16 +58,9 @@ class AbstractPython3(AbstractProgrammingLanguage):
             returnInfo: Const.ReturnInfoType = None,
             **kwargs) -> dict:
 
-        # Language-common state
+        # Language-common state and parameter codes
         result = super().templateDict(**kwargs)
-
-        # Get all parameters (for validator and solutions)
-        result["GetParameters"] = cls.leveledNewline(cls.indentLevelGetParameter).join(
-            cls.generateCodeGetParameter(*param) for param in parameterInfo)
-
-        # Print all parameters (for generators)
-        result["PrintParameters"] = cls.leveledNewline(cls.indentLevelPutParameter).join(
-            cls.generateCodePutParameter(*param) for param in parameterInfo)
+        result.update(cls.parameterTemplateDict(tuple(parameterInfo)))
 
         # Result info
         if returnInfo:
@@ -74,41 +68,91 @@ class AbstractPython3(AbstractProgrammingLanguage):
             result["ReturnTypeBase"] = cls.typeStr(returnType, 0)
             result["ReturnDimension"] = returnDimension
 
-        def registerPath(key: str, path: Path):
-            if path:
-                if not isExistingFile(path):
-                    raise OSError(
-                        "Given path(key = %s, path = %s) isn't existing file" %
-                        (key, path))
-                result[key] = removeExtension(path)
-
         # Set paths
-        registerPath("GeneratorPath", generatorPath)
-        registerPath("ValidatorPath", validatorPath)
-        registerPath("SolutionPath", solutionPath)
-        registerPath("PythonIOHelperPath", ioHelperPath)
+        paths = tuple((key, path) for (key, path) in (
+            ("GeneratorPath", generatorPath),
+            ("ValidatorPath", validatorPath),
+            ("SolutionPath", solutionPath),
+            ("PythonIOHelperPath", ioHelperPath)) if path)
+        for key, path in paths:
+            if not isExistingFile(path):
+                raise OSError(
+                    "Given path(key = %s, path = %s) isn't existing file" %
+                    (key, path))
+        result.update((key, removeExtension(path)) for (key, path) in paths)
 
         # Return
         return result
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def parameterTemplateDict(
+            cls, parameterInfo: typing.Tuple[typing.Tuple[
+                str, Const.IOVariableTypes, int], ...]) -> dict:
+        """
+        Return parameter codes part of `templateDict`.
+        This is cached, so all modules of same class and parameters
+        share the result; Do not modify returned dictionary.
+        """
+        result = {}
+
+        # Separators and code generators
+        getSeparator = cls.leveledNewline(cls.indentLevelGetParameter)
+        putSeparator = cls.leveledNewline(cls.indentLevelPutParameter)
+        generateGet = cls.generateCodeGetParameter
+        generatePut = cls.generateCodePutParameter
+
+        # Get all parameters (for validator and solutions)
+        result["GetParameters"] = getSeparator.join(
+            generateGet(*param) for param in parameterInfo)
+
+        # Print all parameters (for generators)
+        result["PrintParameters"] = putSeparator.join(
+            generatePut(*param) for param in parameterInfo)
+        return result
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def codeFormatGetParameter(
+            cls, parameterType: Const.IOVariableTypes,
+            parameterDimension: int) -> str:
+        """
+        Return format of `generateCodeGetParameter` with types filled.
+        Only `%(name)s` is left to be formatted.
+        """
+        tReal = cls.typeStr(parameterType, 0)
+        tHint = cls.typeStr(parameterType, parameterDimension)
+        return "inputValues['%%(name)s']: %s = TCHIO.parseMulti(inputLineIterator, %s, %d)" % \
+            (tHint, tReal, parameterDimension)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def codeFormatPutParameter(
+            cls, parameterType: Const.IOVariableTypes,
+            parameterDimension: int) -> str:
+        """
+        Return format of `generateCodePutParameter` with types filled.
+        Only `%(name)s` is left to be formatted.
+        """
+        tReal = cls.typeStr(parameterType, 0)
+        return "TCHIO.printData(generated['%%(name)s'], %s, %s, file = outfile); del generated['%%(name)s']" % \
+            (tReal, parameterDimension)
+
     @classmethod
     def generateCodeGetParameter(
             cls, variableName: str,
             parameterType: Const.IOVariableTypes,
             parameterDimension: int) -> str:
-        tReal = cls.typeStr(parameterType, 0)
-        tHint = cls.typeStr(parameterType, parameterDimension)
-        return "inputValues['%s']: %s = TCHIO.parseMulti(inputLineIterator, %s, %d)" % \
-            (variableName, tHint, tReal, parameterDimension)
+        return cls.codeFormatGetParameter(
+            parameterType, parameterDimension) % {"name": variableName}
 
     @classmethod
     def generateCodePutParameter(
             cls, variableName: str,
             parameterType: Const.IOVariableTypes,
             parameterDimension: int) -> str:
-        tReal = cls.typeStr(parameterType, 0)
-        return "TCHIO.printData(generated['%s'], %s, %s, file = outfile); del generated['%s']" % \
-            (variableName, tReal, parameterDimension, variableName)
+        return cls.codeFormatPutParameter(
+            parameterType, parameterDimension) % {"name": variableName}
 
 
 class Python3Generator(AbstractExternalGenerator, AbstractPython3):
@@ -7,13 +7,13 @@ import threading
 from pathlib import Path
 import atexit
 import typing
-import shutil
 import warnings
 import os
+import stat
 
 # Azad libraries
 from .constants import NullSemaphore
-from .misc import randomName, formatPathForLog
+from .misc import yieldRandomNames, formatPathForLog
 from .errors import TempFileSystemClosed
 
 
@@ -60,6 +60,138 @@ def checkBasePath(method):
     return innerFunc
 
 
+# Kernel-side copy functions; `(sourceFD, destFD, offset, count) -> copied`.
+_kernelCopyFunctions = tuple(func for (name, func) in (
+    ("copy_file_range", lambda src, dest, offset, count:
+     os.copy_file_range(src, dest, count, offset)),
+    ("sendfile", lambda src, dest, offset, count:
+     os.sendfile(dest, src, offset, count)),
+) if hasattr(os, name))
+
+
+def fastCopyFile(source: Path, dest: Path, bufferSize: int = 1 << 16):
+    """
+    Copy content of source file into new dest file.
+    Try zero-copy syscalls first(`copy_file_range`, then `sendfile`),
+    and fall back to plain read/write loop for unsupported file systems.
+    """
+    sourceFD = os.open(source, os.O_RDONLY)
+    try:
+        destFD = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            size = os.fstat(sourceFD).st_size
+            copied = 0
+
+            # Zero-copy; Offset of source is explicitly given,
+            # and offset of dest is advanced by kernel.
+            for kernelCopy in _kernelCopyFunctions:
+                try:
+                    while copied < size:
+                        sent = kernelCopy(
+                            sourceFD, destFD, copied, size - copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                except OSError:
+                    continue
+                else:
+                    if copied >= size:
+                        return
+
+            # Fallback
+            os.lseek(sourceFD, copied, os.SEEK_SET)
+            while True:
+                chunk = os.read(sourceFD, bufferSize)
+                if not chunk:
+                    break
+                writeBuffers(destFD, [memoryview(chunk)])
+        finally:
+            os.close(destFD)
+    finally:
+        os.close(sourceFD)
+
+
+# If `fastRemoveTree` can unlink files by `unlinkat` on scanned directory.
+_unlinkByDirFD = os.unlink in os.supports_dir_fd and \
+    os.scandir in os.supports_fd and hasattr(os, "O_DIRECTORY")
+
+
+def fastRemoveTree(path: typing.Union[str, Path]):
+    """
+    Remove given directory and everything inside of it.
+    Walk by `os.scandir` without extra `stat` calls,
+    unlink files first, and remove directories from the deepest one.
+    Where supported, files of each directory are unlinked relative to
+    one directory descriptor, so their paths are not resolved again.
+    """
+    stack = [os.fspath(path)]
+    directories = []
+    while stack:
+        directory = stack.pop()
+        directories.append(directory)
+        if _unlinkByDirFD:
+            dirFD = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                with os.scandir(dirFD) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(os.path.join(directory, entry.name))
+                        else:
+                            os.unlink(entry.name, dir_fd=dirFD)
+            finally:
+                os.close(dirFD)
+        else:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        os.unlink(entry.path)
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
+
+# Type of temporary file content; Sequence is written by single `writev`.
+ContentType = typing.Union[
+    str, bytes, typing.Sequence[typing.Union[str, bytes]], None]
+
+# Maximum number of buffers given to single `writev` call.
+try:
+    _maxWriteBuffers = os.sysconf("SC_IOV_MAX")
+except (ValueError, OSError):
+    _maxWriteBuffers = 16  # POSIX minimum of IOV_MAX
+
+
+def _encodeContent(content: ContentType) -> typing.List[memoryview]:
+    """
+    Normalize content of new temporary file into list of byte buffers.
+    This is done before the semaphore is acquired.
+    """
+    if content is None:
+        return []
+    elif not isinstance(content, (list, tuple)):
+        content = (content,)
+    return [memoryview(segment.encode() if isinstance(segment, str)
+                       else segment).cast("B")
+            for segment in content if segment]
+
+
+def writeBuffers(fd: int, buffers: typing.List[memoryview]):
+    """
+    Write all given buffers into given file descriptor in order,
+    by as few `writev` calls as possible.
+    """
+    while buffers:
+        written = os.writev(fd, buffers[:_maxWriteBuffers])
+        index = 0
+        while index < len(buffers) and written >= len(buffers[index]):
+            written -= len(buffers[index])
+            index += 1
+        buffers = buffers[index:]
+        if buffers:
+            buffers[0] = buffers[0][written:]
+
+
 class TempFileSystem:
     """
     Supports temporary file system by path.
@@ -77,15 +209,33 @@ class TempFileSystem:
         elif self.path.is_file():
             raise NotADirectoryError("Invalid path \"%s\"" % (self.path,))
 
-        # Other attributes
-        self.semaphore = threading.BoundedSemaphore()
-        self.childs = set()
+        # Other attributes; `self.childs` is every path string in this TFS.
+        # Leftovers of previous run are scanned only once here.
+        self.semaphore = threading.Lock()
+        self.childs: typing.Set[str] = set()
+        for directory, dirnames, filenames in os.walk(self.path):
+            self.childs.update(os.path.join(directory, name)
+                               for name in dirnames + filenames)
         self.closed = False
+        self.description: str = None  # Formatted on first use
         atexit.register(self.close, force=True)
 
     def __str__(self):
-        return "Temp file system at \"%s\"" % \
-            (formatPathForLog(self.path),)
+        if self.description is None:
+            self.description = "Temp file system at \"%s\"" % \
+                (formatPathForLog(self.path),)
+        return self.description
+
+    @staticmethod
+    def getNameParts(extension: str = None,
+                     namePrefix: str = None) -> typing.Tuple[str, str]:
+        """
+        Get `(prefix, suffix)` of file/directory name
+        with given prefix and extension.
+        """
+        prefix = (namePrefix + "_") if namePrefix is not None else ""
+        suffix = ("." + extension if extension is not None else "")
+        return (prefix, suffix)
 
     @staticmethod
     def getName(name: str, extension: str = None,
@@ -93,8 +243,8 @@ class TempFileSystem:
         """
         Get complete file/directory name with given prefix and extension.
         """
-        prefix = (namePrefix + "_") if namePrefix is not None else ""
-        suffix = ("." + extension if extension is not None else "")
+        prefix, suffix = TempFileSystem.getNameParts(
+            extension=extension, namePrefix=namePrefix)
         return prefix + name + suffix
 
     def contains(self, name: typing.Union[str, Path]):
@@ -109,55 +259,128 @@ class TempFileSystem:
         else:
             raise TypeError("Invalid name type %s" % (type(name),))
 
-    @checkBasePath
+    def __checkAndLock(self, basePath: Path = None, force: bool = False) \
+            -> typing.Union[typing.Tuple[typing.ContextManager, Path], None]:
+        """
+        Inlined prologue of `checkIfClosed`, `checkBasePath` and
+        `TFSThreadSafe` for hot paths. Return `(lock, basePath)`,
+        or None if this file system is already closed.
+        """
+        if self.closed:
+            warnings.warn("This file system is already closed",
+                          TempFileSystemClosed)
+            return None
+        elif basePath is None:
+            basePath = self.path
+        elif not basePath.relative_to(self.path):
+            raise OSError(
+                "Given basePath \"%s\" is not inside of TFS path \"%s\"" %
+                (basePath, self.path))
+        return (self.semaphore if not force else NullSemaphore, basePath)
+
     def __findFeasiblePath(
             self, extension: str = None, namePrefix: str = None,
             randomNameLength: int = None, basePath: Path = None) -> Path:
         """
         Find any feasible path for new file or folder's name.
+        Given basePath should be already validated.
+        Only `self.childs` is checked instead of the disk;
+        Creation with O_EXCL still guards external collision.
         """
 
         length = self.DefaultRandomNameLength \
             if randomNameLength is None else randomNameLength
 
-        for _ in range(self.DefaultRandomTryIterationLimit):
-            tempPath = basePath / self.getName(
-                randomName(length), extension=extension,
-                namePrefix=namePrefix)
-            if not self.contains(tempPath):
-                return tempPath
+        # Candidates are compared as strings, and only one Path is made.
+        prefix, suffix = self.getNameParts(
+            extension=extension, namePrefix=namePrefix)
+        prefix = os.path.join(basePath, prefix)
+        for _, name in zip(range(self.DefaultRandomTryIterationLimit),
+                           yieldRandomNames(length)):
+            tempPath = prefix + name + suffix
+            if tempPath not in self.childs:
+                return Path(tempPath)
         raise OSError("Couldn't find feasible path in %d iterations" %
                       (self.DefaultRandomTryIterationLimit,))
 
-    @checkIfClosed
-    @checkBasePath
-    @TFSThreadSafe
-    def newTempFile(
-            self, content: typing.Union[str, bytes] = None,
+    def __writeNewTempFile(
+            self, content: typing.List[memoryview] = (),
             name: str = None, extension: str = None,
-            namePrefix: str = None, basePath: Path = None) -> Path:
+            namePrefix: str = None, basePath: Path = None,
+            dirFD: int = None) -> Path:
         """
-        Make new file under this directory.
+        Actual implementation of `newTempFile`.
+        Caller should hold the semaphore, validate the basePath
+        and encode the content by `_encodeContent`.
+        If `dirFD` is given, it should be opened descriptor of basePath.
         """
-        wmode: str = "wb" if isinstance(content, bytes) else "w"
-
         # Determine name
         if name is not None:
             path = basePath / self.getName(
                 name, extension=extension, namePrefix=namePrefix)
-            if self.contains(path):
-                raise FileExistsError
         else:
             path = self.__findFeasiblePath(
                 extension=extension, namePrefix=namePrefix,
                 basePath=basePath)
 
-        # Write content and return
-        with open(path, wmode) as file:
-            if content is not None:
-                file.write(content)
+        # Write content and return;
+        # O_EXCL raises FileExistsError if path is already occupied.
+        fd = os.open(path if dirFD is None else path.name,
+                     os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666,
+                     dir_fd=dirFD)
+        try:
+            writeBuffers(fd, list(content))
+        finally:
+            os.close(fd)
+        self.childs.add(str(path))
         return path
 
+    def newTempFile(
+            self, content: ContentType = None,
+            name: str = None, extension: str = None,
+            namePrefix: str = None, basePath: Path = None,
+            force: bool = False) -> Path:
+        """
+        Make new file under this directory.
+        If content is a sequence of segments(e.g. header and payload),
+        they are written by single `writev` call.
+        """
+        prologue = self.__checkAndLock(basePath, force)
+        if prologue is None:
+            return None
+        lock, basePath = prologue
+        content = _encodeContent(content)
+        with lock:
+            return self.__writeNewTempFile(
+                content=content, name=name, extension=extension,
+                namePrefix=namePrefix, basePath=basePath)
+
+    def newTempFiles(self, *specs: dict, basePath: Path = None,
+                     force: bool = False) -> typing.List[Path]:
+        """
+        Make multiple new files under this directory at once.
+        Each spec is a dictionary of keyword arguments of `newTempFile`,
+        and all files are made while holding the semaphore only once.
+        The basePath is opened only once, and files are created by
+        `openat` relative to it if supported.
+        """
+        prologue = self.__checkAndLock(basePath, force)
+        if prologue is None:
+            return None
+        lock, basePath = prologue
+        specs = [dict(spec, content=_encodeContent(spec.get("content")))
+                 for spec in specs]
+        with lock:
+            dirFD = os.open(basePath, os.O_RDONLY | os.O_DIRECTORY) \
+                if os.open in os.supports_dir_fd else None
+            try:
+                return [self.__writeNewTempFile(
+                    basePath=basePath, dirFD=dirFD, **spec)
+                    for spec in specs]
+            finally:
+                if dirFD is not None:
+                    os.close(dirFD)
+
     @checkIfClosed
     @checkBasePath
     @TFSThreadSafe
@@ -177,6 +400,7 @@ class TempFileSystem:
                 namePrefix=namePrefix, basePath=basePath)
 
         path.mkdir()
+        self.childs.add(str(path))
         return path
 
     @checkIfClosed
@@ -204,8 +428,9 @@ class TempFileSystem:
                 extension=extension, namePrefix=namePrefix,
                 basePath=basePath)
 
-        # Fast copy using shutil
-        shutil.copyfile(source, path)
+        # Fast copy inside of kernel
+        fastCopyFile(source, path)
+        self.childs.add(str(path))
         return path
 
     @checkIfClosed
@@ -223,16 +448,69 @@ class TempFileSystem:
         else:
             raise TypeError("Invalid name type %s" % (type(path),))
 
-        if not self.contains(path):
-            raise FileNotFoundError("name = %s" % (path,))
-        elif path.is_file():  # File
-            with open(path, "rb" if b else "r") as file:
+        # `self.childs` is checked first instead of asking file system,
+        # which is still asked for other spellings of same path or
+        # files made by others under this directory.
+        # File/directory is distinguished by trying to open.
+        pathStr = str(path)
+        if pathStr not in self.childs:
+            if not self.contains(path):
+                raise FileNotFoundError("name = %s" % (path,))
+            pathStr = os.path.normpath(pathStr)  # Key of `self.childs`
+        try:
+            with (open(path, "rb", buffering=0) if b
+                  else open(path, "r")) as file:
                 content = file.read()
+        except IsADirectoryError:  # Directory
+            fastRemoveTree(path)
+            self.childs = {child for child in self.childs
+                           if child != pathStr and
+                           not child.startswith(pathStr + os.sep)}
+            return None
+        else:  # File
             os.remove(path)
+            self.childs.discard(pathStr)
             return content
-        else:  # Directory
-            shutil.rmtree(path)
-            return None
+
+    @checkIfClosed
+    @TFSThreadSafe
+    def popMany(self, paths: typing.Iterable[typing.Union[str, Path]],
+                b: bool = True) -> typing.List[typing.Union[str, bytes, None]]:
+        """
+        Delete multiple files or folders by given names at once,
+        and return their contents like `pop` in same order.
+        Small binary files are read by file descriptor
+        through one reusable buffer.
+        """
+        buffer = bytearray(1 << 16)
+        view = memoryview(buffer)
+        contents = []
+        for path in paths:
+            if isinstance(path, str):
+                path: Path = self.path / path
+            elif not isinstance(path, Path):
+                raise TypeError("Invalid name type %s" % (type(path),))
+
+            # Fast path: Small binary files
+            pathStr = str(path)
+            if b and pathStr in self.childs:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    fileStat = os.fstat(fd)
+                    content = bytes(view[:os.readv(fd, [view])]) \
+                        if stat.S_ISREG(fileStat.st_mode) and \
+                        fileStat.st_size <= len(buffer) else None
+                finally:
+                    os.close(fd)
+                if content is not None:
+                    os.remove(path)
+                    self.childs.discard(pathStr)
+                    contents.append(content)
+                    continue
+
+            # Otherwise: Same as `pop`
+            contents.append(self.pop(path, b=b, force=True))
+        return contents
 
     @checkIfClosed
     @TFSThreadSafe
@@ -241,4 +519,5 @@ class TempFileSystem:
         Close file system by deleting everything.
         """
         self.closed = True
-        shutil.rmtree(self.path)
+        fastRemoveTree(self.path)
+        self.childs.clear()
@@ -5,43 +5,96 @@ This module is used to define and support I/O data (for problems) related stuffs
 # Standard libraries
 import typing
 import os
+import itertools
+import functools
+import math
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Azad libraries
 from . import constants as Const
+from .misc import getAvailableTasksCount
 
 
 def cleanIOFilePath(path: typing.Union[str, Path],
                     targetExtensions: typing.Tuple[str] = ("in", "out", "txt")):
     """
     Remove all files with given extension in given path.
+    Many files are removed by thread pool, since `unlink` releases GIL.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    for filename in path.iterdir():
-        for extension in targetExtensions:
-            if filename.name.endswith(extension):
-                os.remove(filename)
-                break
+    targetExtensions = tuple(targetExtensions)
+    with os.scandir(path) as entries:
+        targets = [entry.path for entry in entries
+                   if entry.name.endswith(targetExtensions) and
+                   not entry.is_dir(follow_symlinks=False)]
+    if len(targets) < Const.ParallelRemovalThreshold:
+        for target in targets:
+            os.remove(target)
+    else:
+        with ThreadPoolExecutor(max_workers=min(
+                Const.MaxRemovalThreads,
+                getAvailableTasksCount() * 4)) as executor:
+            for _ in executor.map(os.remove, targets):
+                pass
 
 
 def yieldLines(path: typing.Union[str, Path]) -> typing.Iterator[str]:
     """
     Read and yield each line until to reach end of file.
+    Whole file is decoded once and split in C level,
+    so no generator frame is resumed per line.
     """
-    with open(path, "rb") as file:
+    with open(path, "rb", buffering=0) as file:
         content = file.read()
-    yield from (b.decode('ascii') for b in content.split(b"\n"))
+    return iter(content.decode('ascii').split("\n"))
 
 
 def PGizeData(data, iovt: Const.IOVariableTypes) -> str:
     """
     Transfer data into Programmers-compatible string.
+    Given data should be nested uniformly, like results of `parseMulti`.
     """
-    if isinstance(data, (list, tuple)):
-        return "[%s]" % (",".join(PGizeData(d, iovt) for d in data),)
-    else:
-        return Const.IODataTypesInfo[iovt]["strize"](data)
+    strize = Const.IODataTypesInfo[iovt]["strize"]
+    if not isinstance(data, (list, tuple)):
+        return strize(data)
+
+    # Depth-first walk writing tokens once, instead of joining each level;
+    # Innermost arrays are strized by single C level join and map.
+    tokens: typing.List[str] = []
+    stack = [iter((data,))]
+    while stack:
+        for element in stack[-1]:
+            if tokens and tokens[-1] != "[":
+                tokens.append(",")
+            if element and isinstance(element[0], (list, tuple)):
+                tokens.append("[")
+                stack.append(iter(element))
+                break
+            tokens.append("[%s]" % (",".join(map(strize, element)),))
+        else:
+            stack.pop()
+            if stack:
+                tokens.append("]")
+    return "".join(tokens)
+
+
+def _parseBool(line: str) -> bool:
+    """
+    Parse the given line as boolean.
+    """
+    if line not in ("true", "false"):
+        raise ValueError
+    return line == "true"
+
+
+# Single parsers of non-string types.
+_singleParsers = {
+    Const.IOVariableTypes.INT: int,
+    Const.IOVariableTypes.LONG: int,
+    Const.IOVariableTypes.FLOAT: float,
+    Const.IOVariableTypes.DOUBLE: float,
+    Const.IOVariableTypes.BOOL: _parseBool,
+}
 
 
 def parseSingle(line: str, targetType: Const.IOVariableTypes) \
@@ -49,16 +102,9 @@ def parseSingle(line: str, targetType: Const.IOVariableTypes) \
     """
     Parse the given line with given target type.
     """
-    if targetType in (Const.IOVariableTypes.INT, Const.IOVariableTypes.LONG):
-        return int(line)
-    elif targetType in (Const.IOVariableTypes.FLOAT, Const.IOVariableTypes.DOUBLE):
-        return float(line)
-    elif targetType is Const.IOVariableTypes.BOOL:
-        if line not in ("true", "false"):
-            raise ValueError
-        return line == "true"
-    else:
+    if targetType not in _singleParsers:
         raise ValueError("Unknown type t(%s) for single parse" % (targetType,))
+    return _singleParsers[targetType](line)
 
 
 def parseMulti(lines: typing.Iterator[str],
@@ -67,37 +113,138 @@ def parseMulti(lines: typing.Iterator[str],
     Parse multiple lines with given target type and dimension.
     This may raise ValueError.
     """
+    if targetType is Const.IOVariableTypes.STRING:
+        parser = None
+    elif targetType in _singleParsers:
+        parser = _singleParsers[targetType]
+    else:
+        raise ValueError("Unknown type t(%s) for single parse" % (targetType,))
+    return _parseMulti(lines, parser,
+                       Const.IODataTypesInfo[targetType]["constraint"],
+                       _arrayConstraint(targetType), dimension)
+
+
+@functools.lru_cache(maxsize=None)
+def _arrayConstraint(targetType: Const.IOVariableTypes) \
+        -> typing.Callable[[list], bool]:
+    """
+    Return constraint function of whole 1D array with given type.
+    Integer arrays are checked by their minimum and maximum only,
+    and floating point arrays are checked by their absolute values
+    first, falling back to element-wise check if zero exists.
+    """
+    constraint = Const.IODataTypesInfo[targetType]["constraint"]
+    if targetType in Const.IntegerTypesRange:
+        low, high = Const.IntegerTypesRange[targetType]
+        return lambda values: \
+            not values or (low <= min(values) and max(values) <= high)
+    elif targetType in Const.FloatTypesRange:
+        low, high = Const.FloatTypesRange[targetType]
+
+        def checkFloats(values: list) -> bool:
+            if not values:
+                return True
+            absValues = list(map(abs, values))
+            if all(map(math.isfinite, absValues)) and \
+                    low <= min(absValues) and max(absValues) <= high:
+                return True
+            return all(map(constraint, values))
+        return checkFloats
+    else:
+        return lambda values: all(map(constraint, values))
+
+
+def _parseSize(lines: typing.Iterator[str]) -> int:
+    """
+    Parse array size or string length from the next line.
+    """
+    size = int(next(lines))
+    if size < 0:
+        raise ValueError("Negative size %d given" % (size,))
+    return size
+
+
+def _parseMulti(lines: typing.Iterator[str],
+                parser: typing.Optional[typing.Callable[[str], typing.Any]],
+                constraint: typing.Callable[[typing.Any], bool],
+                arrayConstraint: typing.Callable[[list], bool],
+                dimension: int):
+    """
+    Actual implementation of `parseMulti` with resolved functions.
+    `parser` is None for string type.
+    """
     if dimension == 0:
-        if targetType is not Const.IOVariableTypes.STRING:
-            result = parseSingle(next(lines), targetType)
+        if parser is not None:
+            result = parser(next(lines))
         else:
-            length = parseSingle(next(lines), Const.IOVariableTypes.INT)
-            result = "".join(chr(parseSingle(next(lines), Const.IOVariableTypes.INT))
-                             for _ in range(length))
-        if not Const.IODataTypesInfo[targetType]["constraint"](result):
+            # Codes out of byte range are rejected here by `bytearray`,
+            # and non-ascii codes are rejected by string constraint.
+            length = _parseSize(lines)
+            codes = bytearray(map(int, itertools.islice(lines, length)))
+            if len(codes) < length:
+                raise StopIteration
+            result = codes.decode("latin-1")
+        if not constraint(result):
+            raise ValueError("Parsed data failed on constraint func")
+        return result
+    elif dimension == 1 and parser is not None:
+        # Innermost arrays are parsed in one C-level map call.
+        size = _parseSize(lines)
+        result = list(map(parser, itertools.islice(lines, size)))
+        if len(result) < size:
+            raise StopIteration
+        elif not arrayConstraint(result):
             raise ValueError("Parsed data failed on constraint func")
         return result
     else:
-        size: int = parseSingle(next(lines), Const.IOVariableTypes.INT)
-        result = [parseMulti(lines, targetType, dimension - 1)
-                  for _ in range(size)]
-        if dimension > 1 and len(set(len(element) for element in result)) > 1:
-            raise ValueError("Generated non-rectangle array")
+        size = _parseSize(lines)
+        result = [_parseMulti(lines, parser, constraint, arrayConstraint,
+                              dimension - 1) for _ in range(size)]
+        if dimension > 1 and result:
+            firstLength = len(result[0])
+            if any(len(element) != firstLength for element in result):
+                raise ValueError("Generated non-rectangle array")
         return result
 
 
+# Types whose `equal` function is plain `==`.
+_exactlyEqualTypes = frozenset((
+    Const.IOVariableTypes.INT, Const.IOVariableTypes.LONG,
+    Const.IOVariableTypes.STRING, Const.IOVariableTypes.BOOL))
+
+
 def isCorrectAnswer(answer, produced, returnType: Const.IOVariableTypes,
                     dimension: int) -> bool:
     """
     Return if produced answer is correct.
     """
-    if dimension > 0:
+    return _isCorrectAnswer(
+        answer, produced, Const.IODataTypesInfo[returnType]["equal"],
+        returnType in _exactlyEqualTypes, dimension)
+
+
+def _isCorrectAnswer(answer, produced,
+                     equal: typing.Callable[[typing.Any, typing.Any], bool],
+                     exactlyEqual: bool, dimension: int) -> bool:
+    """
+    Actual implementation of `isCorrectAnswer` with resolved function.
+    """
+    if dimension > 0 and exactlyEqual:
+        # Nested list comparison is done by C level `==` at once.
+        # This is not applied to floating point types, since `equal`
+        # of same non-finite values(like inf) is False.
+        return isinstance(produced, list) and answer == produced
+    elif dimension > 1:
         if not isinstance(produced, list) or len(answer) != len(produced):
             return False
         for element1, element2 in zip(answer, produced):
-            if not isCorrectAnswer(
-                    element1, element2, returnType, dimension - 1):
+            if not _isCorrectAnswer(
+                    element1, element2, equal, exactlyEqual, dimension - 1):
                 return False
         return True
+    elif dimension == 1:
+        return isinstance(produced, list) and \
+            len(answer) == len(produced) and \
+            all(map(equal, answer, produced))
     else:
-        return Const.IODataTypesInfo[returnType]["equal"](answer, produced)
+        return equal(answer, produced)
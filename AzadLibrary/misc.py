@@ -3,19 +3,27 @@ This module contains miscellaneous functions.
 """
 
 # Standard libraries
-import random
 import warnings
 import logging
 import logging.handlers
 import os
+import stat
 import sys
 import time
 import typing
 from pathlib import Path
 import threading
+import queue
 import copy
+import concurrent.futures
+import functools
+import itertools
 import statistics
+import collections
+import string
 import resource
+import select
+import subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +33,21 @@ from .syntax import extensionSyntax
 from .errors import AzadError
 
 
+@functools.lru_cache(maxsize=8)
+def _barLineBase(lineLength: int) -> str:
+    """
+    Return `<==...==>` of given length.
+    """
+    return "<" + "=" * (lineLength - 2) + ">"
+
+
 def barLine(message: str, lineLength: int = 120) -> str:
     """
     Print `<==...== msg ==...==>`.
     """
     if not isinstance(lineLength, int) or lineLength <= 20:
         raise ValueError("Invalid value lineLength = %s" % (lineLength,))
-    baseMessage = "<" + "=" * (lineLength - 2) + ">"
+    baseMessage = _barLineBase(lineLength)
     # 2x + msglen = total len
     preOffset = (lineLength - len(message)) // 2 - 1
     if preOffset <= 2:
@@ -52,16 +68,33 @@ def longEndSkip(message: str, maxLength: int = 100) -> str:
         return message[:maxLength - 3] + "..."
 
 
+# Translation table of random byte -> English letter or number.
+_randomNameTranslation = bytes(
+    (string.ascii_letters + string.digits).encode("ascii")[x % 62]
+    for x in range(256))
+
+
+def yieldRandomNames(length: int, batchSize: int = 16) \
+        -> typing.Iterator[str]:
+    """
+    Yield random names using English letters and numbers endlessly.
+    Entropy is drawn from `os.urandom` by batch, not by each name.
+    These names are not for security purpose.
+    """
+    if length <= 0:  # Empty batch would never yield anything
+        yield from itertools.repeat("")
+    while True:
+        batch = os.urandom(length * batchSize).translate(
+            _randomNameTranslation).decode("ascii")
+        for i in range(0, len(batch), length):
+            yield batch[i:i + length]
+
+
 def randomName(length: int) -> str:
     """
     Return random name using English letters and numbers.
-    Remind that calling this will reset random seed to arbitrary number.
     """
-    random.seed(time.monotonic_ns())
-    lowercases = "".join(chr(ord('a') + x) for x in range(26))
-    numbers = "".join(chr(ord('0') + x) for x in range(10))
-    candidates = lowercases + lowercases.upper() + numbers
-    return "".join(random.choices(candidates, k=length))
+    return next(yieldRandomNames(length, batchSize=1))
 
 
 def validateVerdict(
@@ -70,13 +103,13 @@ def validateVerdict(
     """
     Validate verdict with intended categories.
     """
-    foundFeasibleCategories = set()  # This should be non-empty
-    for category in verdictCount:
+    foundFeasibleCategory = False  # This should be True
+    for category, count in verdictCount.items():
         if not isinstance(category, Const.Verdict):
             raise TypeError(
                 "Invalid category type %s in verdictCount found" %
                 (type(category),))
-        elif verdictCount[category] == 0:
+        elif count == 0:
             continue
         elif category not in intendedCategories:  # Tolerate AC only
             if category is Const.Verdict.AC:
@@ -84,8 +117,98 @@ def validateVerdict(
             else:
                 return False
         else:
-            foundFeasibleCategories.add(category)
-    return bool(foundFeasibleCategories)
+            foundFeasibleCategory = True
+    return foundFeasibleCategory
+
+
+class CachingFormatter(logging.Formatter):
+    """
+    Log formatter which formats timestamp only once per second,
+    and interpolates each record's message only once
+    even if the record is formatted by multiple handlers.
+    Use this only if date format has no sub-second field.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lastFormattedTime = (None, None)
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record.args:  # Same as what `QueueHandler.prepare` does
+            record.msg = record.getMessage()
+            record.args = None
+        return super().format(record)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        second = int(record.created)
+        lastSecond, lastTimeStr = self.lastFormattedTime
+        if second != lastSecond:
+            lastTimeStr = super().formatTime(record, datefmt)
+            self.lastFormattedTime = (second, lastTimeStr)
+        return lastTimeStr
+
+
+class _BackgroundLogListener(logging.handlers.QueueListener):
+    """
+    Queue listener which also sets `threading.Event` markers
+    put by `BackgroundLogHandler.flush`.
+    """
+
+    def handle(self, record: typing.Union[logging.LogRecord, threading.Event]):
+        if isinstance(record, threading.Event):
+            record.set()
+        else:
+            super().handle(record)
+
+
+class BackgroundLogHandler(logging.handlers.QueueHandler):
+    """
+    Log handler which passes records to given handlers
+    on a background thread, so logging call is just a queue put.
+    Given handlers are closed together when this handler is closed.
+    """
+
+    def __init__(self, *handlers: logging.Handler):
+        super().__init__(queue.SimpleQueue())
+        self.handlers = handlers
+        self.listener = _BackgroundLogListener(
+            self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.stopped = False
+
+    def flush(self):
+        """
+        Wait until every record queued so far is written.
+        """
+        self.acquire()
+        try:
+            if not self.stopped:
+                marker = threading.Event()
+                self.queue.put_nowait(marker)
+                marker.wait()
+                for handler in self.handlers:
+                    handler.flush()
+        finally:
+            self.release()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Record is formatted on background thread, not here.
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return copy.copy(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            if not self.stopped:
+                self.stopped = True
+                self.listener.stop()
+                for handler in self.handlers:
+                    handler.close()
+        finally:
+            self.release()
+        super().close()
 
 
 def setupLoggers(
@@ -109,17 +232,26 @@ def setupLoggers(
         for oldHandler in rootLogger.handlers[::]:
             closeHandler(oldHandler)
 
-    # Main file handler
-    mainFileHandler = logging.handlers.RotatingFileHandler(
-        filename=mainLogFilePath,
-        maxBytes=Const.DefaultLogFileMaxSize,
-        backupCount=Const.DefaultLogFileBackups
-    )
-    MFHformatter = logging.Formatter(
+    # Main file handler; Named pipe can't be rotated,
+    # so plain file handler is used without any size check.
+    if os.path.exists(mainLogFilePath) and \
+            stat.S_ISFIFO(os.stat(mainLogFilePath).st_mode):
+        mainFileHandler = logging.FileHandler(mainLogFilePath, delay=True)
+    else:
+        mainFileHandler = logging.handlers.RotatingFileHandler(
+            filename=mainLogFilePath,
+            maxBytes=Const.DefaultLogFileMaxSize,
+            backupCount=Const.DefaultLogFileBackups
+        )
+    MFHformatter = CachingFormatter(
         Const.DefaultLogBaseFMT % (5000,), Const.DefaultLogDateFMT)
     mainFileHandler.setFormatter(MFHformatter)
     mainFileHandler.setLevel(logging.DEBUG)
-    rootLogger.addHandler(mainFileHandler)
+
+    # Records are formatted and written into file on background thread.
+    mainBackgroundHandler = BackgroundLogHandler(mainFileHandler)
+    mainBackgroundHandler.setLevel(logging.DEBUG)
+    rootLogger.addHandler(mainBackgroundHandler)
 
     # Main stream handler
     if not noStreamHandler:
@@ -135,7 +267,7 @@ def setupLoggers(
                     closeHandler(oldHandler)
 
         mainStreamHandler = logging.StreamHandler(sys.stdout)
-        MSHformatter = logging.Formatter(
+        MSHformatter = CachingFormatter(
             Const.DefaultLogBaseFMT % (120,), Const.DefaultLogDateFMT)
         mainStreamHandler.setFormatter(MSHformatter)
         mainStreamHandler.setLevel(logging.INFO)
@@ -145,12 +277,14 @@ def setupLoggers(
     rootLogger.setLevel(logLevel)
 
 
+@functools.lru_cache(maxsize=1)
 def getAvailableTasksCount() -> int:
     """
     Get available CPU count for this process.
     If it's not available(like FreeBSD etc),
     then try to find physical number of CPUs.
     If physical number of CPUs is undeterminable, return 1 instead.
+    Result is cached; Use `cache_clear` if CPU affinity is changed.
     """
     try:
         return max(len(os.sched_getaffinity(0)), 1)
@@ -163,36 +297,46 @@ def isExistingFile(path: Path) -> bool:
     """
     Check if given path is existing file.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    return isinstance(path, Path) and path.exists() and path.is_file()
+    return isinstance(path, (str, Path)) and os.path.isfile(path)
+
+
+def getFileName(path: typing.Union[str, Path]) -> str:
+    """
+    Return given path's final component, like `Path.name`,
+    without constructing `Path` from string.
+    """
+    return path.name if isinstance(path, Path) else \
+        os.path.basename(path.rstrip(os.sep))
 
 
 def getExtension(path: typing.Union[str, Path]) -> typing.Union[str, None]:
     """
     Return given path's file extension if exists.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    filenameSplitted = path.name.split(".")
-    if len(filenameSplitted) > 1 and \
-            extensionSyntax.fullmatch(filenameSplitted[-1]):
-        return filenameSplitted[-1]
+    _, separator, extension = getFileName(path).rpartition(".")
+    if separator and extensionSyntax.fullmatch(extension):
+        return extension
     else:
         return None
 
 
+@functools.lru_cache(maxsize=1024)
 def removeExtension(path: typing.Union[str, Path]) -> str:
     """
     Return given path's filename without extension.
+    Results are cached since same paths are asked repeatedly.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    extension = getExtension(path)
-    if extension is None:
-        return path.name
+    name = getFileName(path)
+    stem, separator, extension = name.rpartition(".")
+    if separator and extensionSyntax.fullmatch(extension):
+        return stem
     else:
-        return path.name[:-(len(extension) + 1)]
+        return name
+
+
+# Reusable thread pools of `runThreads`, by concurrency limit.
+_threadPools: typing.Dict[int, concurrent.futures.ThreadPoolExecutor] = {}
+_threadPoolsLock = threading.Lock()
 
 
 def runThreads(
@@ -204,10 +348,18 @@ def runThreads(
         -> typing.Tuple[float, typing.List[float]]:
     """
     Run multiple threads on same function but different arguments.
-    """
-
-    # Semaphore and execution time measure
-    semaphore = threading.BoundedSemaphore(concurrencyLimit)
+    Worker threads are reused across calls with same concurrency limit,
+    so don't call this inside of given function.
+    """
+
+    # Thread pool and execution time measure
+    with _threadPoolsLock:
+        if concurrencyLimit not in _threadPools:
+            _threadPools[concurrencyLimit] = \
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=concurrencyLimit,
+                    thread_name_prefix="AzadWorker%d" % (concurrencyLimit,))
+        pool = _threadPools[concurrencyLimit]
     dtDistribution = [None for _ in range(len(argss))]
 
     def tempFunc(index, *args, **kwargs):
@@ -215,25 +367,24 @@ def runThreads(
         Temporary function which runs given function,
         but with several additional functionalities.
         """
-        with semaphore:
-            logger.debug("Running %s #%d..", funcName, index + 1)
-            startTime = time.perf_counter()
-            func(*args, **kwargs)
-            endTime = time.perf_counter()
-            logger.debug("Finishing %s #%d in %gs.. (Global dt)",
-                         funcName, index + 1, endTime - startTime)
+        logger.debug("Running %s #%d..", funcName, index + 1)
+        startTime = time.perf_counter()
+        func(*args, **kwargs)
+        endTime = time.perf_counter()
+        logger.debug("Finishing %s #%d in %gs.. (Global dt)",
+                     funcName, index + 1, endTime - startTime)
         dtDistribution[index] = endTime - startTime
 
-    # Make, run, and join threads
-    threads = [threading.Thread(
-        target=tempFunc, args=(i,) + args, kwargs=kwargs)
-        for (i, (args, kwargs)) in enumerate(argss)]
+    # Submit and wait tasks
     startTime = time.perf_counter()
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join(timeout=timeout)
+    futures = [pool.submit(tempFunc, i, *args, **kwargs)
+               for (i, (args, kwargs)) in enumerate(argss)]
+    concurrent.futures.wait(futures, timeout=timeout)
     endTime = time.perf_counter()
+    for i, future in enumerate(futures):
+        if future.done() and future.exception() is not None:
+            logger.error("Exception raised in %s #%d", funcName, i + 1,
+                         exc_info=future.exception())
     return (endTime - startTime, dtDistribution)
 
 
@@ -252,11 +403,30 @@ def formatPathForLog(path: Path, maxDepth: int = 3) -> str:
     """
     Format given path to string for log file.
     """
-    base = copy.deepcopy(path)
-    for _ in range(maxDepth):
-        base = base.parent
-    return ("" if base is base.parent else "...") + \
-        str(path.relative_to(base))
+    # `Path` is immutable, so base is directly taken from `path.parents`.
+    # Only absolute root is considered as reached top.
+    parents = path.parents
+    if maxDepth >= len(parents):
+        base = parents[len(parents) - 1] if parents else path
+        prefix = "" if path.anchor else "..."
+    else:
+        base = parents[maxDepth - 1] if maxDepth > 0 else path
+        prefix = "..."
+    return prefix + str(path.relative_to(base))
+
+
+# Resource ids limited for each subprocess.
+_limitedResources = (resource.RLIMIT_CPU, resource.RLIMIT_AS,
+                     resource.RLIMIT_DATA, resource.RLIMIT_STACK)
+
+
+@functools.lru_cache(maxsize=None)
+def _getHardLimits() -> typing.Dict[int, int]:
+    """
+    Return hard limits of this process, which are inherited by subprocesses.
+    These are read once, since hard limits can't be raised anyway.
+    """
+    return {rid: resource.getrlimit(rid)[1] for rid in _limitedResources}
 
 
 def getLimitResourceFunction(TL: float, ML: float) \
@@ -266,20 +436,19 @@ def getLimitResourceFunction(TL: float, ML: float) \
     soft time limit and soft memory limit.
     All errors will be dropped.
     """
-    def func():
-        import resource
+    hardLimits = _getHardLimits()
+    softTL, softML = max(1, round(TL)), round(ML * (1 << 20))
 
+    def func():
         # Setting CPU time limit
-        _, hardTL = resource.getrlimit(resource.RLIMIT_CPU)
         resource.setrlimit(
-            resource.RLIMIT_CPU, (max(1, round(TL)), hardTL))
+            resource.RLIMIT_CPU, (softTL, hardLimits[resource.RLIMIT_CPU]))
 
         # Setting total memory amount
         for rid in (resource.RLIMIT_AS, resource.RLIMIT_DATA,
                     resource.RLIMIT_STACK):
             try:
-                _, hardML = resource.getrlimit(rid)
-                resource.setrlimit(rid, (round(ML * (1 << 20)), hardML))
+                resource.setrlimit(rid, (softML, hardLimits[rid]))
             except (OSError, ValueError):
                 pass
 
@@ -290,19 +459,44 @@ def prlimitSubprocessResource(pid: int, TL: float, ML: float):
     """
     Use prlimit directly to limit specific process's
     soft time limit and soft memory limit.
+    Hard limits are not read from the process, since it inherits ours.
     """
-    _, hardTL = resource.prlimit(pid, resource.RLIMIT_CPU)
-    resource.prlimit(pid, resource.RLIMIT_CPU, (max(1, round(TL)), hardTL))
+    hardLimits = _getHardLimits()
+    resource.prlimit(pid, resource.RLIMIT_CPU,
+                     (max(1, round(TL)), hardLimits[resource.RLIMIT_CPU]))
 
+    softML = round(ML * (1 << 20))
     for rid in (resource.RLIMIT_AS, resource.RLIMIT_DATA,
                 resource.RLIMIT_STACK):
         try:
-            _, hardML = resource.prlimit(pid, rid)
-            resource.prlimit(pid, rid, (round(ML * (1 << 20)), hardML))
+            resource.prlimit(pid, rid, (softML, hardLimits[rid]))
         except (OSError, ValueError):
             pass
 
 
+def waitSubprocess(process: subprocess.Popen, timeout: float) -> int:
+    """
+    Wait given subprocess with timeout and return its exit code.
+    `Popen.wait` with timeout polls `waitpid` with sleeps up to 50ms,
+    so process fd is waited in single blocking `poll` call if possible.
+    Raise `subprocess.TimeoutExpired` if time is over.
+    """
+    if process.returncode is None and hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:  # Old kernel or already reaped process
+            pass
+        else:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                if not poller.poll(max(0, timeout) * 1000):
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+            finally:
+                os.close(pidfd)
+    return process.wait(timeout)
+
+
 def reportSolutionStatistics(
         verdicts: typing.List[Const.Verdict],
         dtDistribution: typing.List[float],
@@ -311,22 +505,27 @@ def reportSolutionStatistics(
     Report statistics based on verdicts and dt distribution.
     """
 
-    # Brief report first
-    logger.info("Verdict brief: %s", " / ".join("%s %g%%" % (
-        verdict.name, 1e2 * verdicts.count(verdict) / len(verdicts))
-        for verdict in Const.Verdict)
-    )
-    if len(dtDistribution) > 1:
-        dtQuantiles = statistics.quantiles(dtDistribution, n=quantilesCount)
-        dtQuantiles = [min(dtDistribution)] + \
-            dtQuantiles + [max(dtDistribution)]
-        logger.info("DT brief (not precise): %s", " / ".join("Q%d %gs" % (
-            i, dtQuantiles[i]) for i in range(len(dtQuantiles))))
+    # Brief report first; Reports are built only if they will be logged.
+    if logger.isEnabledFor(logging.INFO):
+        verdictCount = collections.Counter(verdicts)
+        logger.info("Verdict brief: %s", " / ".join("%s %g%%" % (
+            verdict.name, 1e2 * verdictCount[verdict] / len(verdicts))
+            for verdict in Const.Verdict)
+        )
+        if len(dtDistribution) > 1:
+            # Sorted once; `quantiles` sorts it again in linear time.
+            sortedDT = sorted(dtDistribution)
+            dtQuantiles = [sortedDT[0]] + statistics.quantiles(
+                sortedDT, n=quantilesCount) + [sortedDT[-1]]
+            logger.info("DT brief (not precise): %s", " / ".join(
+                "Q%d %gs" % (i, dtQuantiles[i])
+                for i in range(len(dtQuantiles))))
 
     # Detail individuals
-    logger.debug("Verdicts: [%s]", ", ".join(v.name for v in verdicts))
-    logger.debug("DT distribution: [%s]", ", ".join(
-        "%gs" % (dt,) for dt in dtDistribution))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Verdicts: [%s]", ", ".join(v.name for v in verdicts))
+        logger.debug("DT distribution: [%s]", ", ".join(
+            "%gs" % (dt,) for dt in dtDistribution))
 
 
 def reportCompilationFailure(
@@ -338,14 +537,15 @@ def reportCompilationFailure(
     """
     newArgs = [formatPathForLog(arg) if isinstance(arg, Path)
                else arg for arg in args]
-    with open(errLogPath, "r") as errLogFile:
-        logger.error(
-            "Compilation failure on %s \"%s\"; args = %s, log =\n%s",
-            moduleType.name, formatPathForLog(modulePath),
-            newArgs, errLogFile.read())
-        raise AzadError(
-            "Compilation failure on %s \"%s\"; args = %s" %
-            (moduleType.name, formatPathForLog(modulePath), newArgs))
+    if logger.isEnabledFor(logging.ERROR):  # Read log only if needed
+        with open(errLogPath, "r") as errLogFile:
+            logger.error(
+                "Compilation failure on %s \"%s\"; args = %s, log =\n%s",
+                moduleType.name, formatPathForLog(modulePath),
+                newArgs, errLogFile.read())
+    raise AzadError(
+        "Compilation failure on %s \"%s\"; args = %s" %
+        (moduleType.name, formatPathForLog(modulePath), newArgs))
 
 
 if __name__ == "__main__":
@@ -9,7 +9,20 @@ def yieldInputLines(file: typing.IO[str]):
     """
     Yield each line from input.
     """
-    yield from file.read().split("\n")
+    return iter(file.read().split("\n"))
+
+
+def _parseBool(line: str) -> bool:
+    assert line in ("true", "false")
+    return line == "true"
+
+
+# Single parsers of non-string types.
+_singleParsers = {
+    int: int,
+    float: float,
+    bool: _parseBool,
+}
 
 
 def parseSingle(line: str, targetType: type) \
@@ -17,60 +30,106 @@ def parseSingle(line: str, targetType: type) \
     """
     Parse the given line with given target type.
     """
-    if targetType is int:
-        return int(line)
-    elif targetType is float:
-        return float(line)
-    elif targetType is bool:
-        assert line in ("true", "false")
-        return line == "true"
-    else:
+    if targetType not in _singleParsers:
         raise TypeError("Unknown type t(%s)" % (targetType,))
+    return _singleParsers[targetType](line)
 
 
 def parseMulti(lines: typing.Iterator[str], targetType: type, dimension: int):
     """
     Parse multiple lines with given target type and dimension.
     """
+    if targetType is not str and targetType not in _singleParsers:
+        raise TypeError("Unknown type t(%s)" % (targetType,))
+    return _parseMulti(lines, _singleParsers.get(targetType), dimension)
+
+
+def _parseMulti(lines: typing.Iterator[str],
+                parser: typing.Optional[typing.Callable[[str], typing.Any]],
+                dimension: int):
+    """
+    Actual implementation of `parseMulti` with resolved parser.
+    `parser` is None for string type.
+    """
     if dimension == 0:
-        if targetType is not str:
-            return parseSingle(next(lines), targetType)
+        if parser is not None:
+            return parser(next(lines))
         else:
-            length = parseSingle(next(lines), int)
-            return "".join(chr(parseSingle(next(lines), int))
-                           for _ in range(length))
+            length = int(next(lines))
+            return "".join(chr(int(next(lines))) for _ in range(length))
+    elif dimension == 1 and parser is not None:
+        size = int(next(lines))
+        return [parser(next(lines)) for _ in range(size)]
     else:
-        size: int = parseSingle(next(lines), int)
-        return [parseMulti(lines, targetType, dimension - 1)
+        size = int(next(lines))
+        return [_parseMulti(lines, parser, dimension - 1)
                 for _ in range(size)]
 
 
+def _strizeInt(value: int, tokens: typing.List[str]):
+    assert isinstance(value, int)
+    tokens.append(str(value))
+
+
+def _strizeFloat(value: typing.Union[float, Decimal, Fraction],
+                 tokens: typing.List[str]):
+    assert isinstance(value, (float, Decimal, Fraction))
+    tokens.append("%.20g" % (value,))
+
+
+def _strizeBool(value: bool, tokens: typing.List[str]):
+    assert isinstance(value, bool)
+    tokens.append("true" if value else "false")
+
+
+def _strizeStr(value: str, tokens: typing.List[str]):
+    assert isinstance(value, str)
+    tokens.append(str(len(value)))
+    tokens.extend(str(ord(ch)) for ch in value)
+
+
+# Strize functions of single values, which append parts into tokens.
+_singleStrizers = {
+    int: _strizeInt,
+    float: _strizeFloat,
+    bool: _strizeBool,
+    str: _strizeStr,
+}
+
+
+def strizeTokens(value: typing.Union[int, float, bool, str],
+                 targetType: type, dimension: int) -> typing.List[str]:
+    """
+    Return each part of strized data from
+    given value and target type/dimension.
+    Nested values are walked by explicit stack instead of recursion.
+    """
+    if targetType not in _singleStrizers:
+        raise TypeError
+    strizeSingle = _singleStrizers[targetType]
+    tokens = []
+    stack = [(iter((value,)), dimension)]
+    while stack:
+        iterator, depth = stack[-1]
+        for element in iterator:
+            if depth > 0:
+                assert isinstance(element, (list, tuple))
+                tokens.append(str(len(element)))
+                stack.append((iter(element), depth - 1))
+                break
+            strizeSingle(element, tokens)
+        else:
+            stack.pop()
+    return tokens
+
+
 def yieldStrized(value: typing.Union[int, float, bool, str],
                  targetType: type, dimension: int) -> typing.Iterator[str]:
     """
     Yield each part of strized data from
     given value and target type/dimension.
     """
-    if dimension > 0:
-        assert isinstance(value, (list, tuple))
-        yield str(len(value))
-        for element in value:
-            yield from yieldStrized(element, targetType, dimension - 1)
-    elif targetType is int:
-        assert isinstance(value, int)
-        yield str(value)
-    elif targetType is float:
-        assert isinstance(value, (float, Decimal, Fraction))
-        yield "%.20g" % (value,)
-    elif targetType is bool:
-        assert isinstance(value, bool)
-        yield "true" if value else "false"
-    elif targetType is str:
-        assert isinstance(value, str)
-        yield str(len(value))
-        yield from (str(ord(ch)) for ch in value)
-    else:
-        raise TypeError
+    return iter(strizeTokens(value, targetType, dimension))
 
 
 def printData(value: typing.Union[int, float, bool, str],
@@ -80,10 +139,9 @@ def printData(value: typing.Union[int, float, bool, str],
     Output given value into output file.
     Assume given file is opened in binary mode.
     """
-    file.write(b'\n'.join(
-        c.encode('ascii') for c in
-        yieldStrized(value, targetType, dimension)))
-    file.write(b'\n')
+    tokens = strizeTokens(value, targetType, dimension)
+    tokens.append("")
+    file.write("\n".join(tokens).encode('ascii'))
 
 
 def printException(err: Exception, file: typing.IO = stderr):
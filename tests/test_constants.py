@@ -0,0 +1,73 @@
+"""
+Tests of helper functions in `AzadLibrary.constants`.
+"""
+
+# Standard libraries
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+# Azad libraries
+from AzadLibrary import constants as Const
+
+
+def referenceCheckPrecision(a, b, precision=Const.DefaultFloatPrecision):
+    """
+    Original division based formula of `checkPrecision`.
+    """
+    if abs(a) <= precision ** 2:
+        return abs(a - b) <= precision
+    else:
+        return abs(a - b) <= precision or abs((a - b) / a) <= precision
+
+
+def outcome(func, *args):
+    """
+    Return result of given call, or type of raised exception.
+    """
+    try:
+        return func(*args)
+    except Exception as err:
+        return type(err)
+
+
+_specialValues = (0.0, -0.0, 1e-12, 1e-6, 1.0, -1.0, 1e300, -1e300,
+                  5e-324, float("inf"), float("-inf"), float("nan"))
+
+
+@pytest.mark.parametrize("a", _specialValues)
+@pytest.mark.parametrize("b", _specialValues + (5.0, 1.0 + 1e-7))
+def test_checkPrecision_special_values(a, b):
+    assert Const.checkPrecision(a, b) == referenceCheckPrecision(a, b)
+
+
+@pytest.mark.parametrize("precision", [1e-9, 1e-6, 1e-2, 0.5])
+def test_checkPrecision_random(precision):
+    rng = random.Random(precision)
+    for _ in range(20000):
+        a = rng.uniform(-1, 1) * 10 ** rng.randint(-12, 12)
+        b = a * (1 + rng.uniform(-3, 3) * precision) \
+            if rng.random() < 0.8 else rng.uniform(-1, 1)
+        assert Const.checkPrecision(a, b, precision) == \
+            referenceCheckPrecision(a, b, precision), (a, b)
+
+
+@pytest.mark.parametrize("a, b", [
+    (Decimal("1.0000001"), Decimal("1")),
+    (Decimal("1000"), Decimal("1000.01")),
+    (Decimal("1e-20"), Decimal("2e-20")),
+    (Decimal("Infinity"), Decimal("5")),
+    (Fraction(1, 3), Fraction(1, 3) + Fraction(1, 10 ** 9)),
+    (Fraction(10 ** 6), 10 ** 6 + 0.5),
+    (3, 3), (10 ** 7, 10 ** 7 + 5), (10 ** 400, 10 ** 400 + 1),
+])
+def test_checkPrecision_non_float(a, b):
+    assert outcome(Const.checkPrecision, a, b) == \
+        outcome(referenceCheckPrecision, a, b)
+
+
+def test_checkPrecision_invalid_precision():
+    with pytest.raises(ValueError):
+        Const.checkPrecision(1.0, 1.0, 0)
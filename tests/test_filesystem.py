@@ -0,0 +1,193 @@
+"""
+Tests of temporary file system in `AzadLibrary.filesystem`.
+"""
+
+# Standard libraries
+import atexit
+import os
+from pathlib import Path
+
+import pytest
+
+# Azad libraries
+from AzadLibrary import filesystem
+from AzadLibrary.misc import formatPathForLog
+from AzadLibrary.filesystem import (
+    TempFileSystem, fastCopyFile, fastRemoveTree, writeBuffers,
+    _encodeContent)
+
+
+@pytest.fixture
+def tfs(tmp_path: Path):
+    fs = TempFileSystem(tmp_path / "tfs")
+    atexit.unregister(fs.close)
+    yield fs
+    if not fs.closed:
+        fs.close()
+
+
+def test_pop_file_and_folder(tfs: TempFileSystem):
+    filePath = tfs.newTempFile(content="abc", extension="txt")
+    folder = tfs.newFolder()
+    inner = tfs.newTempFile(content="x", basePath=folder)
+    assert tfs.pop(filePath) == b"abc"
+    assert not filePath.exists()
+    assert tfs.pop(folder) is None
+    assert not folder.exists()
+    with pytest.raises(FileNotFoundError):
+        tfs.pop(inner)
+
+
+def test_pop_text_mode(tfs: TempFileSystem):
+    filePath = tfs.newTempFile(content=b"line\n")
+    assert tfs.pop(filePath, b=False) == "line\n"
+
+
+def test_pop_other_spelling(tfs: TempFileSystem):
+    folder = tfs.newFolder(name="sub")
+    filePath = tfs.newTempFile(content="abc", name="spelled")
+    otherSpelling = folder / ".." / "spelled"
+    assert str(otherSpelling) not in tfs.childs
+    assert tfs.pop(otherSpelling) == b"abc"
+    assert not filePath.exists()
+    assert str(filePath) not in tfs.childs
+    with pytest.raises(FileNotFoundError):
+        tfs.pop(filePath)
+
+
+def test_pop_externally_created(tfs: TempFileSystem):
+    (tfs.path / "external.txt").write_bytes(b"outside")
+    (tfs.path / "externalDir" / "sub").mkdir(parents=True)
+    (tfs.path / "externalDir" / "sub" / "f").write_bytes(b"")
+    assert tfs.pop("external.txt") == b"outside"
+    assert tfs.pop("externalDir") is None
+    assert not (tfs.path / "externalDir").exists()
+
+
+def test_pop_missing(tfs: TempFileSystem):
+    with pytest.raises(FileNotFoundError):
+        tfs.pop("missing")
+    filePath = tfs.newTempFile(content="abc")
+    assert tfs.pop(filePath) == b"abc"
+    with pytest.raises(FileNotFoundError):
+        tfs.pop(filePath)
+
+
+def test_str(tfs: TempFileSystem):
+    assert str(tfs) == 'Temp file system at "%s"' % \
+        (formatPathForLog(tfs.path),)
+    assert str(tfs) is str(tfs)
+
+
+def test_fastCopyFile_fallback_short_writes(tmp_path: Path, monkeypatch):
+    realWrite = os.write
+
+    def shortWrite(fd, data):
+        # Write at most 1000 bytes per call.
+        return realWrite(fd, bytes(data)[:1000])
+
+    def shortWritev(fd, buffers):
+        return shortWrite(fd, b"".join(bytes(buffer) for buffer in buffers))
+
+    monkeypatch.setattr(filesystem, "_kernelCopyFunctions", ())
+    monkeypatch.setattr(os, "write", shortWrite)
+    monkeypatch.setattr(os, "writev", shortWritev)
+    content = os.urandom(200000)
+    (tmp_path / "source").write_bytes(content)
+    fastCopyFile(tmp_path / "source", tmp_path / "dest", bufferSize=4096)
+    assert (tmp_path / "dest").read_bytes() == content
+
+
+def test_popMany(tfs: TempFileSystem):
+    small = tfs.newTempFile(content="small")
+    large = tfs.newTempFile(content=b"L" * (1 << 17))
+    empty = tfs.newTempFile()
+    folder = tfs.newFolder()
+    tfs.newTempFile(content="inner", basePath=folder)
+    assert tfs.popMany([small, large, empty, folder]) == \
+        [b"small", b"L" * (1 << 17), b"", None]
+    for path in (small, large, empty, folder):
+        assert not path.exists()
+    assert list(tfs.path.iterdir()) == []
+
+
+def test_popMany_text_mode(tfs: TempFileSystem):
+    paths = [tfs.newTempFile(content=str(i)) for i in range(3)]
+    assert tfs.popMany(paths, b=False) == ["0", "1", "2"]
+
+
+def test_popMany_missing(tfs: TempFileSystem):
+    existing = tfs.newTempFile(content="abc")
+    with pytest.raises(FileNotFoundError):
+        tfs.popMany([existing, tfs.path / "missing"])
+    assert not existing.exists()
+
+    # Known to this file system, but removed by others
+    removed = tfs.newTempFile(content="abc")
+    os.remove(removed)
+    with pytest.raises(FileNotFoundError):
+        tfs.popMany([removed])
+
+
+def test_fastRemoveTree(tmp_path: Path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "kept").write_bytes(b"")
+    root = tmp_path / "root"
+    (root / "a" / "b" / "c").mkdir(parents=True)
+    (root / "a" / "b" / "c" / "f").write_bytes(b"1")
+    (root / "a" / "g").write_bytes(b"2")
+    (root / "link").symlink_to(outside, target_is_directory=True)
+    fastRemoveTree(root)
+    assert not root.exists()
+    assert (outside / "kept").exists()
+
+
+@pytest.mark.parametrize("unlinkByDirFD", [
+    pytest.param(True, marks=pytest.mark.skipif(
+        not filesystem._unlinkByDirFD, reason="unlinkat is not supported")),
+    False,
+])
+def test_fastRemoveTree_unlink_modes(tmp_path: Path, monkeypatch,
+                                     unlinkByDirFD: bool):
+    monkeypatch.setattr(filesystem, "_unlinkByDirFD", unlinkByDirFD)
+    root = tmp_path / "root"
+    for i in range(3):
+        (root / str(i) / "inner").mkdir(parents=True)
+        for j in range(5):
+            (root / str(i) / ("f%d" % (j,))).write_bytes(b"")
+        (root / str(i) / "inner" / "g").write_bytes(b"")
+    (root / "dangling").symlink_to(tmp_path / "missing")
+    fastRemoveTree(root)
+    assert not root.exists()
+
+
+@pytest.mark.parametrize("content, expected", [
+    (None, b""),
+    ("", b""),
+    ("text", b"text"),
+    (b"bytes", b"bytes"),
+    (["head", b"\x00\xff", "", b"", "tail"], b"head\x00\xfftail"),
+    (("a", b"b"), b"ab"),
+    ([str(i) for i in range(3000)], "".join(str(i) for i in range(3000)).encode()),
+])
+def test_newTempFile_content(tfs: TempFileSystem, content, expected):
+    assert tfs.newTempFile(content=content).read_bytes() == expected
+
+
+def test_writeBuffers_partial_writes(tmp_path: Path, monkeypatch):
+    realWritev = os.writev
+
+    def shortWritev(fd, buffers):
+        # Write at most 3 bytes of given buffers per call.
+        data = b"".join(bytes(buffer) for buffer in buffers)[:3]
+        return realWritev(fd, [data])
+
+    monkeypatch.setattr(os, "writev", shortWritev)
+    buffers = _encodeContent(["ab", b"", b"cdefg", "h", b"ijklmnop"])
+    fd = os.open(tmp_path / "out", os.O_WRONLY | os.O_CREAT)
+    try:
+        writeBuffers(fd, buffers)
+    finally:
+        os.close(fd)
+    assert (tmp_path / "out").read_bytes() == b"abcdefghijklmnop"
@@ -0,0 +1,140 @@
+"""
+Tests of I/O data parsing in `AzadLibrary.iodata`.
+"""
+
+# Standard libraries
+import random
+
+import pytest
+
+# Azad libraries
+from AzadLibrary import constants as Const
+from AzadLibrary.iodata import parseMulti, isCorrectAnswer
+
+INT = Const.IOVariableTypes.INT
+LONG = Const.IOVariableTypes.LONG
+DOUBLE = Const.IOVariableTypes.DOUBLE
+FLOAT = Const.IOVariableTypes.FLOAT
+STRING = Const.IOVariableTypes.STRING
+BOOL = Const.IOVariableTypes.BOOL
+
+
+def parse(text: str, targetType: Const.IOVariableTypes, dimension: int):
+    return parseMulti(iter(text.split("\n")), targetType, dimension)
+
+
+@pytest.mark.parametrize("text, targetType, dimension, expected", [
+    ("3\n1\n-2\n3", INT, 1, [1, -2, 3]),
+    ("0", INT, 1, []),
+    ("2\n2\n1\n2\n2\n3\n4", LONG, 2, [[1, 2], [3, 4]]),
+    ("0", INT, 2, []),
+    ("2\n0.5\n0", DOUBLE, 1, [0.5, 0.0]),
+    ("2\ntrue\nfalse", BOOL, 1, [True, False]),
+    ("2\n104\n105", STRING, 0, "hi"),
+    ("0", STRING, 0, ""),
+    ("2\n1\n97\n0", STRING, 1, ["a", ""]),
+])
+def test_parseMulti_valid(text, targetType, dimension, expected):
+    assert parse(text, targetType, dimension) == expected
+
+
+@pytest.mark.parametrize("text, targetType, dimension", [
+    ("-1", INT, 1),
+    ("-1", INT, 2),
+    ("1\n-1", INT, 2),
+    ("-1", STRING, 0),
+    ("1\n-1", STRING, 1),
+    ("-1", DOUBLE, 3),
+])
+def test_parseMulti_negative_size(text, targetType, dimension):
+    with pytest.raises(ValueError, match="Negative size"):
+        parse(text, targetType, dimension)
+
+
+@pytest.mark.parametrize("text, targetType, dimension", [
+    ("3\n1\n2", INT, 1),
+    ("2\n1\n1", INT, 2),
+    ("3\n97", STRING, 0),
+])
+def test_parseMulti_truncated(text, targetType, dimension):
+    with pytest.raises(StopIteration):
+        parse(text, targetType, dimension)
+
+
+@pytest.mark.parametrize("text, targetType, dimension", [
+    ("1\n2147483648", INT, 1),
+    ("1\n-2147483649", INT, 1),
+    ("1\n9223372036854775808", LONG, 1),
+    ("2\n1\n1e39", FLOAT, 1),
+    ("1\ninf", DOUBLE, 1),
+    ("1\nnan", DOUBLE, 1),
+    ("1\n1e-320", DOUBLE, 1),
+    ("1\nTrue", BOOL, 1),
+    ("1\nx", INT, 1),
+    ("1\n1.5", INT, 1),
+    ("2\n1\n1\n2\n1\n2", INT, 2),
+    ("1\n200", STRING, 0),
+    ("1\n256", STRING, 0),
+    ("1\n34", STRING, 0),
+])
+def test_parseMulti_rejected(text, targetType, dimension):
+    with pytest.raises(ValueError):
+        parse(text, targetType, dimension)
+
+
+def referenceIsCorrectAnswer(answer, produced,
+                             returnType: Const.IOVariableTypes, dimension: int):
+    """
+    Plain element-wise recursion, which `isCorrectAnswer` should match.
+    """
+    if dimension > 0:
+        if not isinstance(produced, list) or len(answer) != len(produced):
+            return False
+        return all(referenceIsCorrectAnswer(e1, e2, returnType, dimension - 1)
+                   for e1, e2 in zip(answer, produced))
+    else:
+        return Const.IODataTypesInfo[returnType]["equal"](answer, produced)
+
+
+_randomValues = {
+    INT: (0, 1, -1, 7),
+    BOOL: (True, False, 0, 1),
+    STRING: ("", "a", "b"),
+    DOUBLE: (0.0, 1.0, 1.0 + 1e-9, -2.5, 1e300, float("inf"),
+             float("-inf"), float("nan")),
+}
+
+
+def randomData(rng: random.Random, targetType: Const.IOVariableTypes,
+               dimension: int):
+    if dimension == 0:
+        return rng.choice(_randomValues[targetType])
+    return [randomData(rng, targetType, dimension - 1)
+            for _ in range(rng.randint(0, 2))]
+
+
+def mutate(rng: random.Random, data, targetType: Const.IOVariableTypes,
+           dimension: int):
+    choice = rng.random()
+    if choice < 0.3:
+        return data
+    elif choice < 0.4:
+        return tuple(data) if dimension > 0 else data
+    elif choice < 0.5 or dimension == 0 or not data:
+        return randomData(rng, targetType, dimension)
+    result = list(data)
+    index = rng.randrange(len(result))
+    result[index] = mutate(rng, result[index], targetType, dimension - 1)
+    return result
+
+
+@pytest.mark.parametrize("targetType", list(_randomValues))
+@pytest.mark.parametrize("dimension", [0, 1, 2, 3])
+def test_isCorrectAnswer_matches_reference(targetType, dimension):
+    rng = random.Random("%s-%d" % (targetType.value, dimension))
+    for _ in range(3000):
+        answer = randomData(rng, targetType, dimension)
+        produced = mutate(rng, answer, targetType, dimension)
+        assert isCorrectAnswer(answer, produced, targetType, dimension) == \
+            referenceIsCorrectAnswer(answer, produced, targetType, dimension), \
+            (answer, produced)
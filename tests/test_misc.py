@@ -0,0 +1,81 @@
+"""
+Tests of logging and naming helpers in `AzadLibrary.misc`.
+"""
+
+# Standard libraries
+import itertools
+import logging
+import string
+import time
+from pathlib import Path
+
+import pytest
+
+# Azad libraries
+from AzadLibrary.misc import (
+    BackgroundLogHandler, setupLoggers, formatPathForLog,
+    randomName, yieldRandomNames)
+
+
+def test_background_log_flush_and_close(tmp_path: Path):
+    logPath = tmp_path / "test.log"
+    rootLogger = logging.getLogger()
+    oldHandlers, oldLevel = rootLogger.handlers[::], rootLogger.level
+    try:
+        setupLoggers(logPath, False, noStreamHandler=True,
+                     logLevel=logging.DEBUG)
+        handler, = (h for h in rootLogger.handlers if h not in oldHandlers)
+        assert isinstance(handler, BackgroundLogHandler)
+        fileHandler, = handler.handlers
+        fileHandler.addFilter(lambda record: time.sleep(1e-3) or True)
+
+        for i in range(200):
+            logging.getLogger("test").debug("line %d", i)
+        handler.flush()
+        with open(logPath, "a") as logFile:
+            logFile.write("separator\n")
+        lines = logPath.read_text().splitlines()
+        assert len(lines) == 201 and lines[-1] == "separator"
+        assert lines[-2].endswith("line 199")
+
+        # Wrapped file handler is closed together.
+        rootLogger.removeHandler(handler)
+        handler.close()
+        assert fileHandler.stream is None
+        handler.flush()  # Flushing closed handler does nothing.
+    finally:
+        for handler in rootLogger.handlers[::]:
+            if handler not in oldHandlers:
+                rootLogger.removeHandler(handler)
+                handler.close()
+        rootLogger.setLevel(oldLevel)
+
+
+def referenceFormatPathForLog(path: Path, maxDepth: int = 3) -> str:
+    """
+    Original `.parent` walk of `formatPathForLog`.
+    """
+    base = path
+    for _ in range(maxDepth):
+        base = base.parent
+    return ("" if base is base.parent else "...") + \
+        str(path.relative_to(base))
+
+
+@pytest.mark.parametrize("path", [
+    "/", "/a", "/a/b", "/a/b/c", "/a/b/c/d", "/a/b/c/d/e",
+    ".", "tfs", "a/b", "a/b/c", "a/b/c/d", "a/b/c/d/e",
+])
+@pytest.mark.parametrize("maxDepth", [0, 1, 2, 3, 4])
+def test_formatPathForLog(path: str, maxDepth: int):
+    assert formatPathForLog(Path(path), maxDepth) == \
+        referenceFormatPathForLog(Path(path), maxDepth)
+
+
+@pytest.mark.parametrize("length", [0, 1, 5, 32])
+def test_random_names(length: int):
+    candidates = set(string.ascii_letters + string.digits)
+    names = [randomName(length)] + \
+        list(itertools.islice(yieldRandomNames(length, 3), 10))
+    for name in names:
+        assert len(name) == length and set(name) <= candidates
@@ -0,0 +1,76 @@
+"""
+Tests of Python I/O helper `resources/helpers/tchio.py`,
+which is copied next to generated Python modules.
+"""
+
+# Standard libraries
+import importlib.util
+import io
+
+import pytest
+
+# Azad libraries
+from AzadLibrary import constants as Const
+
+_spec = importlib.util.spec_from_file_location(
+    "tchio", Const.ResourcesPath / "helpers" / "tchio.py")
+TCHIO = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(TCHIO)
+
+
+def parse(text: str, targetType: type, dimension: int):
+    return TCHIO.parseMulti(
+        TCHIO.yieldInputLines(io.StringIO(text)), targetType, dimension)
+
+
+@pytest.mark.parametrize("text, targetType, dimension, expected", [
+    ("7", int, 0, 7),
+    ("3\n1\n-2\n3", int, 1, [1, -2, 3]),
+    ("2\n2\n1\n2\n0", int, 2, [[1, 2], []]),
+    ("2\n0.5\n1e3", float, 1, [0.5, 1000.0]),
+    ("2\ntrue\nfalse", bool, 1, [True, False]),
+    ("2\n104\n105", str, 0, "hi"),
+    ("2\n1\n97\n0", str, 1, ["a", ""]),
+])
+def test_parseMulti_valid(text, targetType, dimension, expected):
+    assert parse(text, targetType, dimension) == expected
+
+
+@pytest.mark.parametrize("text, targetType, dimension, error", [
+    ("3\n1\n2", int, 1, StopIteration),
+    ("2\n1\n1", int, 2, StopIteration),
+    ("3\n97", str, 0, RuntimeError),  # StopIteration inside generator
+    ("1\nx", int, 1, ValueError),
+    ("1\n1.5", int, 1, ValueError),
+    ("x", int, 1, ValueError),
+    ("1\nTrue", bool, 1, AssertionError),
+    ("1\n1", list, 1, TypeError),
+])
+def test_parseMulti_malformed(text, targetType, dimension, error):
+    with pytest.raises(error):
+        parse(text, targetType, dimension)
+
+
+@pytest.mark.parametrize("value, targetType, dimension, expected", [
+    (7, int, 0, "7\n"),
+    ([[1, 2], []], int, 2, "2\n2\n1\n2\n0\n"),
+    ([True, False], bool, 1, "2\ntrue\nfalse\n"),
+    (["a", ""], str, 1, "2\n1\n97\n0\n"),
+    (0.5, float, 0, "0.5\n"),
+])
+def test_printData_roundtrip(value, targetType, dimension, expected):
+    buffer = io.BytesIO()
+    TCHIO.printData(value, targetType, dimension, buffer)
+    assert buffer.getvalue().decode("ascii") == expected
+    assert parse(expected, targetType, dimension) == value
+
+
+@pytest.mark.parametrize("value, targetType, dimension", [
+    ([1, "2"], int, 1),
+    ([[1], 2], int, 2),
+    (1, bool, 0),
+    (1, float, 0),
+])
+def test_printData_wrong_type(value, targetType, dimension):
+    with pytest.raises(AssertionError):
+        TCHIO.printData(value, targetType, dimension, io.BytesIO())